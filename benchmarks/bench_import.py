@@ -0,0 +1,63 @@
+'''
+Measures import time of the package using `python -X importtime`.
+
+Each scenario is run in a fresh interpreter several times and the best cumulative
+time of the top-level imports is reported, together with the number of imported
+`guinea` modules.
+
+Run with `python benchmarks/bench_import.py`.
+'''
+
+import os
+import subprocess
+import sys
+
+RUNS = 5
+
+SCENARIOS = {
+    'import guinea': 'import guinea',
+    'from guinea import Text': 'from guinea import Text',
+    'from guinea import events': 'from guinea import events',
+    'from guinea import *': 'from guinea import *',
+}
+
+def measure(code: str) -> tuple[int, int]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env.get('PYTHONPATH'))))
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True)
+
+    total_us = 0
+    guinea_modules = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+
+        # only top-level entries are summed, nested ones are included in their parents
+        if not name.startswith('  '):
+            total_us += int(cumulative)
+
+        if name.strip().split('.')[0] == 'guinea':
+            guinea_modules += 1
+
+    return (total_us, guinea_modules)
+
+def main() -> None:
+    print(f'{"scenario":<28} {"best [ms]":>10} {"modules":>8}')
+
+    for name, code in SCENARIOS.items():
+        results = [measure(code) for _ in range(RUNS)]
+        best_us = min(x[0] for x in results)
+
+        print(f'{name:<28} {best_us / 1000:>10.2f} {results[0][1]:>8}')
+
+if __name__ == '__main__':
+    main()
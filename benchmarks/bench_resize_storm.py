@@ -0,0 +1,134 @@
+'''
+Counts layout passes during a simulated 200-event resize drag.
+
+Every scenario is run twice: with the baseline widgets, which lay out the whole tree
+on every resize event (as it was done before resizes were coalesced), and with
+the regular widgets, which coalesce (and optionally debounce) resizes.
+
+Run with `python benchmarks/bench_resize_storm.py`.
+'''
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# package is imported from the repository, so the benchmark can be run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame as pg
+
+pg.init()
+pg.display.set_mode((800, 600))
+
+import guinea as gn  # noqa: E402
+from guinea.window import _calculate_child_rect  # noqa: E402
+
+EVENT_COUNT = 200
+FRAME_TIME = 0.004
+DEBOUNCE = 0.05
+
+class CountingColumn(gn.Column):
+    layout_count = 0
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        CountingColumn.layout_count += 1
+        return super().calculate_size(max_width, max_height)
+
+# baseline widgets lay out their subtree straight from the event handler
+class EagerFullscreen(gn.Fullscreen):
+    def _handle_video_resize(self, event: pg.event.Event) -> None:
+        self.rect.size = (event.w, event.h)
+        self.calculate_size(event.w, event.h)
+        self.set_placement(0, 0)
+
+class EagerWindow(gn.Window):
+    def _pointer_motion_callback(self, pos: tuple[int, int], rel: tuple[int, int]) -> None:
+        super()._pointer_motion_callback(pos, rel)
+
+        if self.resize_side is not None:
+            self._child_rect = _calculate_child_rect(self.rect, self._title_bar_rect)
+            self.child.calculate_size(*self._child_rect.size)
+            self.child.set_placement(self._child_rect.x, self._child_rect.y)
+            self._child_layout_size = self._child_rect.size
+
+def build_tree() -> gn.Widget:
+    return CountingColumn([gn.Container(gn.Text(f'Label {i}'), bg=pg.Color(200, 200, 200)) for i in range(20)])
+
+def run_frames(group: pg.sprite.LayeredUpdates, events: list[pg.event.Event], events_per_frame: int, eager: bool) -> tuple[int, float]:
+    CountingColumn.layout_count = 0
+    start = time.perf_counter()
+
+    for i in range(0, len(events), events_per_frame):
+        if eager:
+            # events (including pointer motion) are handled one by one
+            for event in events[i:i + events_per_frame]:
+                gn.process_events([event])
+        else:
+            gn.process_events(events[i:i + events_per_frame])
+
+        group.update()
+        time.sleep(FRAME_TIME)
+
+    # let debounced layouts settle
+    time.sleep(DEBOUNCE)
+    group.update()
+
+    return CountingColumn.layout_count, time.perf_counter() - start
+
+def bench_fullscreen(events_per_frame: int, debounce: float, eager: bool) -> tuple[int, float]:
+    root = EagerFullscreen(build_tree()) if eager else gn.Fullscreen(build_tree(), resize_debounce=debounce)
+    group = pg.sprite.LayeredUpdates()
+    gn.Widget.register_widget_stack(group, root)
+    group.update()
+
+    events = [
+        pg.event.Event(pg.VIDEORESIZE, w=800 - i, h=600 - i, size=(800 - i, 600 - i))
+        for i in range(EVENT_COUNT)]
+
+    result = run_frames(group, events, events_per_frame, eager)
+
+    # handlers of widgets from previous runs would otherwise keep laying them out
+    root.kill()
+
+    return result
+
+def bench_window(events_per_frame: int, debounce: float, eager: bool) -> tuple[int, float]:
+    rect = pg.Rect(100, 100, 400, 300)
+    window = EagerWindow(build_tree(), 'Window', rect) if eager else gn.Window(build_tree(), 'Window', rect, resize_debounce=debounce)
+    group = pg.sprite.LayeredUpdates()
+    group.add(window)
+    group.update()
+
+    # grab the right border
+    border = (window.rect.right, window.rect.centery)
+    events = [pg.event.Event(pg.MOUSEBUTTONDOWN, pos=border, button=1)]
+    events.extend(
+        pg.event.Event(pg.MOUSEMOTION, pos=(border[0] + i, border[1]), rel=(1, 0), buttons=(1, 0, 0))
+        for i in range(EVENT_COUNT))
+    events.append(pg.event.Event(pg.MOUSEBUTTONUP, pos=(border[0] + EVENT_COUNT, border[1]), button=1))
+
+    result = run_frames(group, events, events_per_frame, eager)
+    window.kill()
+
+    return result
+
+def main() -> None:
+    print(f'{"":<52}{"baseline":>22}{"coalesced":>22}')
+    print(f'{"scenario":<52}{"layouts":>10}{"time [s]":>12}{"layouts":>10}{"time [s]":>12}')
+
+    for name, bench in (('fullscreen', bench_fullscreen), ('window border drag', bench_window)):
+        for label, events_per_frame, debounce in (
+                ('update per event', 1, 0.0),
+                ('10 events per frame', 10, 0.0),
+                (f'update per event, {DEBOUNCE}s debounce', 1, DEBOUNCE)):
+            baseline_layouts, baseline_elapsed = bench(events_per_frame, debounce, True)
+            layouts, elapsed = bench(events_per_frame, debounce, False)
+            print(
+                f'{name + ", " + label:<52}'
+                f'{baseline_layouts:>10}{baseline_elapsed:>12.3f}'
+                f'{layouts:>10}{elapsed:>12.3f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+'''
+Compares frame time of the surface backend (blitting all sprites into the display
+surface) with `TextureRenderer` using the SDL software renderer.
+
+The scene is a column of labels, of which a few are redrawn every frame.
+Run with `python benchmarks/bench_texture_renderer.py`.
+'''
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# package is imported from the repository, so the benchmark can be run without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame as pg
+
+pg.init()
+
+import guinea as gn  # noqa: E402
+from guinea.texture_renderer import TextureRenderer  # noqa: E402
+
+SIZE = (1280, 720)
+FRAMES = 300
+BG = pg.Color(30, 30, 30)
+
+def build_scene(rows: int) -> tuple[pg.sprite.LayeredUpdates, list[gn.Widget]]:
+    labels: list[gn.Widget] = [gn.Text(f'Label {i}' * 8) for i in range(rows)]
+    root = gn.Fullscreen(gn.Column(labels))
+
+    group = pg.sprite.LayeredUpdates()
+    gn.Widget.register_widget_stack(group, root)
+    group.update()
+
+    return group, labels
+
+def redraw_some(labels: list[gn.Widget], frame: int, changes_per_frame: int) -> None:
+    for i in range(changes_per_frame):
+        labels[(frame * changes_per_frame + i) % len(labels)]._needs_redraw = True
+
+def bench_surface(rows: int, changes_per_frame: int) -> float:
+    screen = pg.display.set_mode(SIZE)
+    group, labels = build_scene(rows)
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        redraw_some(labels, frame, changes_per_frame)
+        group.update()
+
+        screen.fill(BG)
+        group.draw(screen)
+        pg.display.flip()
+
+    return (time.perf_counter() - start) / FRAMES
+
+def bench_texture(rows: int, changes_per_frame: int) -> tuple[float, int]:
+    pg.display.set_mode(SIZE)
+    renderer = TextureRenderer.create('bench', SIZE, bg=BG)
+    group, labels = build_scene(rows)
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        redraw_some(labels, frame, changes_per_frame)
+        group.update()
+
+        renderer.draw(group)
+        renderer.present()
+
+    return (time.perf_counter() - start) / FRAMES, renderer.uploads_count
+
+def main() -> None:
+    print(f'{"scenario":<32}{"surface [ms]":>14}{"texture [ms]":>14}{"uploads":>10}')
+
+    for rows, changes_per_frame in ((40, 0), (40, 4), (40, 40), (200, 4)):
+        surface_time = bench_surface(rows, changes_per_frame)
+        texture_time, uploads = bench_texture(rows, changes_per_frame)
+
+        name = f'{rows} labels, {changes_per_frame} redrawn'
+        print(f'{name:<32}{surface_time * 1000:>14.3f}{texture_time * 1000:>14.3f}{uploads:>10}')
+
+if __name__ == '__main__':
+    main()
@@ -2,20 +2,37 @@
 A module for GUI creation in Pygame.
 '''
 
-from ._internal import OverflowBehavior, set_overflow_behavior
-from .button import Button
-from .column import Column
-from .container import Container, PaddingValue
-from .events import process_event
-from .fraction import Fraction
-from .fullscreen import Fullscreen
-from .image import Image, ImageFilter
-from .progress_bar import ProgressBar
-from .row import MainAxisSize, Row
-from .stack import Stack
-from .text import Text, TextAlign, TextFit
-from .widget import ContainerWidget, SingleChildContainerWidget, Widget
-from .window import Window
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from ._internal import (FontCacheStats, OverflowBehavior, get_font_cache_stats, set_font_cache_size,
+                            set_font_index_path, set_overflow_behavior, warm_up_fonts)
+    from .button import Button
+    from .column import Column
+    from .container import Container, PaddingValue
+    from .data_grid import DataGrid, DataGridColumn
+    from .document_view import DocumentView
+    from .events import process_event, process_events
+    from .flex import Flex
+    from .fraction import Fraction
+    from .fullscreen import Fullscreen
+    from .grid import Grid
+    from .image import Image, ImageFilter
+    from .layout_file import Layout, load_layout
+    from .log_view import LogView
+    from .progress_bar import ProgressBar
+    from .row import MainAxisSize, Row
+    from .scheduler import (RedrawStats, disable_redraw_budget, enable_redraw_budget,
+                            get_redraw_stats, run_scheduled_redraws)
+    from .scroll_view import ScrollView
+    from .stack import Stack
+    from .text import Text, TextAlign, TextFit
+    from .texture_renderer import TextureRenderer
+    from .widget import ContainerWidget, SingleChildContainerWidget, Widget
+    from .window import Window
+    from .window_manager import WindowManager
+    from .workers import disable_threaded_redraw, enable_threaded_redraw
 
 __all__ = (
     'Column',
@@ -32,11 +49,107 @@ __all__ = (
     'TextFit',
     'Button',
     'process_event',
+    'process_events',
     'set_overflow_behavior',
+    'set_font_index_path',
+    'set_font_cache_size',
+    'get_font_cache_stats',
+    'warm_up_fonts',
+    'FontCacheStats',
     'OverflowBehavior',
     'Stack',
     'Fraction',
+    'Flex',
+    'Grid',
     'MainAxisSize',
     'Window',
+    'WindowManager',
+    'ScrollView',
     'Container',
-    'ProgressBar')
+    'ProgressBar',
+    'LogView',
+    'DocumentView',
+    'DataGrid',
+    'DataGridColumn',
+    'Layout',
+    'load_layout',
+    'TextureRenderer',
+    'enable_threaded_redraw',
+    'disable_threaded_redraw',
+    'enable_redraw_budget',
+    'disable_redraw_budget',
+    'run_scheduled_redraws',
+    'get_redraw_stats',
+    'RedrawStats')
+
+# public names are imported from their modules on first access, so using
+# a single widget does not require importing the whole package
+_LAZY_ATTRIBUTES = {
+    'OverflowBehavior': '_internal',
+    'set_font_index_path': '_internal',
+    'set_font_cache_size': '_internal',
+    'get_font_cache_stats': '_internal',
+    'warm_up_fonts': '_internal',
+    'FontCacheStats': '_internal',
+    'set_overflow_behavior': '_internal',
+    'Button': 'button',
+    'Column': 'column',
+    'Container': 'container',
+    'PaddingValue': 'container',
+    'DataGrid': 'data_grid',
+    'DataGridColumn': 'data_grid',
+    'DocumentView': 'document_view',
+    'process_event': 'events',
+    'process_events': 'events',
+    'Flex': 'flex',
+    'Fraction': 'fraction',
+    'Fullscreen': 'fullscreen',
+    'Grid': 'grid',
+    'Image': 'image',
+    'ImageFilter': 'image',
+    'Layout': 'layout_file',
+    'load_layout': 'layout_file',
+    'LogView': 'log_view',
+    'ProgressBar': 'progress_bar',
+    'MainAxisSize': 'row',
+    'Row': 'row',
+    'RedrawStats': 'scheduler',
+    'disable_redraw_budget': 'scheduler',
+    'enable_redraw_budget': 'scheduler',
+    'get_redraw_stats': 'scheduler',
+    'run_scheduled_redraws': 'scheduler',
+    'ScrollView': 'scroll_view',
+    'Stack': 'stack',
+    'Text': 'text',
+    'TextAlign': 'text',
+    'TextFit': 'text',
+    'TextureRenderer': 'texture_renderer',
+    'ContainerWidget': 'widget',
+    'SingleChildContainerWidget': 'widget',
+    'Widget': 'widget',
+    'Window': 'window',
+    'WindowManager': 'window_manager',
+    'disable_threaded_redraw': 'workers',
+    'enable_threaded_redraw': 'workers'}
+
+def __getattr__(name: str) -> t.Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        # submodules (e.g. `guinea.events`) are available without importing them explicitly
+        try:
+            return importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f'{__name__}.{name}':
+                raise
+
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # `__import__` (unlike `importlib.import_module`) is reported by `-X importtime`
+    module = __import__(module_name, globals(), None, (name,), 1)
+    value = getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,12 @@
+import collections
+import json
 import math
 import os
+import sys
+import threading
+import types
+import typing as t
+import weakref
 
 import pygame as pg
 
@@ -7,6 +14,10 @@ from guinea.enums import OverflowBehavior
 from guinea.shaders import Shader
 
 TargetFill = pg.Color | pg.Surface | Shader
+TCallable = t.TypeVar('TCallable', bound=t.Callable[..., t.Any])
+
+# fonts are not safe to use from multiple threads at once (see `guinea.workers`)
+font_lock = threading.RLock()
 
 class _ImageCache:
     _cache: dict[tuple[str, bool], pg.Surface] = {}
@@ -36,28 +47,345 @@ class _ImageCache:
 
         return img
 
+class FontIndex:
+    '''
+    Persistent mapping of system font names to font files. Scanning system fonts
+    (as done by `pg.font.SysFont`) is slow, so its results are stored on disk and
+    reused as long as modification times of font directories do not change.
+    '''
+
+    VERSION = 1
+
+    _path: str | None = None
+    _fonts: dict[str, str] | None = None
+
+    @staticmethod
+    def resolve(name: str) -> str | None:
+        '''
+        Returns path of the font file for given name (or comma-separated names, the first
+        available is used) or `None` if no such font is installed.
+        '''
+
+        with font_lock:
+            if FontIndex._fonts is None:
+                FontIndex._fonts = FontIndex._load()
+
+            for single_name in name.split(','):
+                path = FontIndex._fonts.get(_get_simple_font_name(single_name))
+                if path is not None:
+                    return path
+
+        return None
+
+    @staticmethod
+    def set_path(path: str | None) -> None:
+        with font_lock:
+            FontIndex._path = path
+            FontIndex._fonts = None
+
+    @staticmethod
+    def get_path() -> str | None:
+        return FontIndex._path or _get_default_font_index_path()
+
+    @staticmethod
+    def _load() -> dict[str, str]:
+        path = FontIndex.get_path()
+
+        if path is not None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+
+                if index.get('version') == FontIndex.VERSION and index.get('platform') == sys.platform and _are_mtimes_valid(index['directories']):
+                    return index['fonts']
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                pass
+
+        fonts = _scan_system_fonts()
+
+        if path is not None:
+            directories = set(_get_system_font_roots())
+            directories.update(os.path.dirname(x) for x in fonts.values())
+
+            index = {
+                'version': FontIndex.VERSION,
+                'platform': sys.platform,
+                'directories': {x: _get_mtime(x) for x in sorted(directories)},
+                'fonts': fonts}
+
+            # index is only an optimization, so failing to write it is not an error
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+
+                tmp_path = f'{path}.{os.getpid()}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(index, f)
+
+                os.replace(tmp_path, path)
+            except OSError:
+                pass
+
+        return fonts
+
+class FontCacheStats(t.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
 class FontCache:
-    _cache: dict[tuple[str, int], pg.font.Font] = {}
+    DEFAULT_MAX_SIZE = 64
+    DEFAULT_FONT_NAME = 'consolas'
+
+    # least recently used fonts are first; evicted fonts stay valid for widgets which still use them
+    _cache = collections.OrderedDict[tuple[str, int], pg.font.Font]()
+    _keys = weakref.WeakKeyDictionary[pg.font.Font, tuple[str, int]]()
+    _max_size = DEFAULT_MAX_SIZE
+    _lock = threading.Lock()
+
+    _hits = 0
+    _misses = 0
+    _evictions = 0
 
     @staticmethod
     def get_font(name: str, size: int) -> pg.font.Font:
         key = (name, size)
-        if key in FontCache._cache:
-            return FontCache._cache[key]
 
-        font = pg.font.SysFont(name, size)
-        FontCache._cache[key] = font
+        with FontCache._lock:
+            font = FontCache._cache.get(key)
+            if font is not None:
+                FontCache._cache.move_to_end(key)
+                FontCache._hits += 1
+
+                return font
+
+            FontCache._misses += 1
+
+        # font is loaded without holding the cache lock, so other fonts can be looked up meanwhile
+        with font_lock:
+            font = pg.font.Font(FontIndex.resolve(name), size)
+
+        with FontCache._lock:
+            # the same font could have been loaded by another thread in the meantime
+            existing_font = FontCache._cache.get(key)
+            if existing_font is not None:
+                FontCache._cache.move_to_end(key)
+                return existing_font
+
+            FontCache._cache[key] = font
+            FontCache._keys[font] = key
+
+            FontCache._evict(FontCache._max_size)
 
         return font
 
+    @staticmethod
+    def warm_up(fonts: t.Iterable[tuple[str, int]]) -> threading.Thread:
+        '''
+        Loads given fonts into the cache on a background thread. Returns the started thread.
+        '''
+
+        fonts = list(fonts)
+
+        def _load_fonts() -> None:
+            for name, size in fonts:
+                FontCache.get_font(name, size)
+
+        thread = threading.Thread(target=_load_fonts, name='guinea-font-warm-up', daemon=True)
+        thread.start()
+
+        return thread
+
+    @staticmethod
+    def set_max_size(max_size: int) -> None:
+        with FontCache._lock:
+            FontCache._max_size = max_size
+            FontCache._evict(max_size)
+
+    @staticmethod
+    def get_stats() -> FontCacheStats:
+        with FontCache._lock:
+            return FontCacheStats(
+                FontCache._hits,
+                FontCache._misses,
+                FontCache._evictions,
+                len(FontCache._cache),
+                FontCache._max_size)
+
+    @staticmethod
+    def _evict(max_size: int) -> None:
+        while len(FontCache._cache) > max_size:
+            FontCache._cache.popitem(last=False)
+            FontCache._evictions += 1
+
+    @staticmethod
+    def get_font_key(font: pg.font.Font) -> tuple[str, int] | None:
+        '''
+        Returns name and size of a font created by `FontCache` or `None` for other fonts.
+        '''
+
+        return FontCache._keys.get(font)
+
     @staticmethod
     def get_default_of_size(size: int) -> pg.font.Font:
-        return FontCache.get_font('consolas', size)
+        return FontCache.get_font(FontCache.DEFAULT_FONT_NAME, size)
+
+class StrongCallbackRef(t.Generic[TCallable]):
+    __slots__ = ('_callback',)
+
+    def __init__(self, callback: TCallable) -> None:
+        self._callback = callback
+
+    def __call__(self) -> TCallable:
+        return self._callback
+
+class WeakMethodRef(t.Generic[TCallable]):
+    __slots__ = ('_self_ref', '_func')
+
+    def __init__(self, method: types.MethodType, on_dead: t.Callable[[], None] | None = None) -> None:
+        self._self_ref = weakref.ref(method.__self__, None if on_dead is None else lambda _: on_dead())
+        self._func = method.__func__
+
+    def __call__(self) -> TCallable | None:
+        obj = self._self_ref()
+        if obj is None:
+            return None
+
+        return t.cast(TCallable, types.MethodType(self._func, obj))
+
+    @property
+    def owner(self) -> object | None:
+        return self._self_ref()
+
+def make_callback_ref(callback: TCallable, on_dead: t.Callable[[], None] | None = None) -> t.Callable[[], TCallable | None]:
+    '''
+    Creates reference to a callback. Bound methods are referenced weakly (`on_dead` is called
+    after the object they are bound to is collected), other callables are referenced strongly.
+    '''
+
+    if isinstance(callback, types.MethodType):
+        return WeakMethodRef[TCallable](callback, on_dead)
+
+    return StrongCallbackRef(callback)
+
+class TextMetricsCache:
+    _word_widths = weakref.WeakKeyDictionary[pg.font.Font, dict[str, int]]()
+
+    @staticmethod
+    def get_word_widths(font: pg.font.Font, words: t.Iterable[str]) -> list[int]:
+        with font_lock:
+            cache = TextMetricsCache._word_widths.get(font)
+            if cache is None:
+                cache = TextMetricsCache._word_widths[font] = {}
+
+            result = list[int]()
+            for word in words:
+                width = cache.get(word)
+                if width is None:
+                    width = cache[word] = font.size(word)[0]
+
+                result.append(width)
+
+        return result
+
+def warm_up_fonts(fonts: t.Iterable[tuple[str, int]]) -> threading.Thread:
+    '''
+    Preloads fonts (given as `(name, size)` pairs) on a background thread, e.g. while
+    a splash screen is shown. Returns the started thread, which can be joined.
+    '''
+
+    return FontCache.warm_up(fonts)
+
+def set_font_cache_size(max_size: int) -> None:
+    '''
+    Sets maximum number of fonts kept in the font cache. Least recently used fonts are evicted first.
+    '''
+
+    FontCache.set_max_size(max_size)
+
+def get_font_cache_stats() -> FontCacheStats:
+    return FontCache.get_stats()
+
+def set_font_index_path(path: str | None) -> None:
+    '''
+    Sets path of the persistent system font index. If `None`, default location
+    in the user cache directory is used.
+    '''
+
+    FontIndex.set_path(path)
+
+def _get_simple_font_name(name: str) -> str:
+    # same normalization as used by `pg.font.SysFont`
+    return ''.join(x for x in name.lower() if x.isalnum())
+
+def _scan_system_fonts() -> dict[str, str]:
+    import pygame.sysfont
+
+    pygame.sysfont.initsysfonts()
+
+    fonts = dict[str, str]()
+    for fonts_by_name in (pygame.sysfont.Sysfonts, pygame.sysfont.Sysalias):
+        for name, styles in fonts_by_name.items():
+            if name in fonts or len(styles) == 0:
+                continue
+
+            # regular style is preferred, just like in `pg.font.SysFont`
+            path = styles.get((False, False)) or next(iter(styles.values()))
+            fonts[name] = path
+
+    return fonts
+
+def _get_system_font_roots() -> list[str]:
+    home = os.path.expanduser('~')
+
+    if sys.platform == 'win32':
+        return [
+            os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+            os.path.join(os.environ.get('LOCALAPPDATA', home), 'Microsoft', 'Windows', 'Fonts')]
+
+    if sys.platform == 'darwin':
+        return [
+            '/Library/Fonts',
+            '/System/Library/Fonts',
+            os.path.join(home, 'Library', 'Fonts')]
+
+    return [
+        '/usr/share/fonts',
+        '/usr/local/share/fonts',
+        os.path.join(home, '.fonts'),
+        os.path.join(home, '.local', 'share', 'fonts')]
+
+def _get_default_font_index_path() -> str | None:
+    if sys.platform == 'win32':
+        cache_dir = os.environ.get('LOCALAPPDATA')
+    elif sys.platform == 'darwin':
+        cache_dir = os.path.expanduser('~/Library/Caches')
+    else:
+        cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+
+    if not cache_dir:
+        return None
+
+    return os.path.join(cache_dir, 'guinea', 'font_index.json')
+
+def _get_mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _are_mtimes_valid(directories: dict[str, int | None]) -> bool:
+    # directory mtime changes when fonts (or subdirectories) are added to or removed from it
+    return all(_get_mtime(path) == mtime for path, mtime in directories.items())
 
 def set_overflow_behavior(behavior: OverflowBehavior) -> None:
     global _overflow_behavior
     _overflow_behavior = behavior
 
+def get_overflow_behavior() -> OverflowBehavior:
+    return _overflow_behavior
+
 def round(x: int | float) -> int:
     if _overflow_behavior == OverflowBehavior.OVERFLOW:
         return math.ceil(x)
@@ -8,6 +8,8 @@ from guinea.widget import SingleChildContainerWidget, Widget
 
 
 class Align(SingleChildContainerWidget):
+    layout_state_attributes = ('_available_width', '_available_height')
+
     def __init__(self,
                  child: Widget,
                  *,
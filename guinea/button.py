@@ -5,11 +5,13 @@ import uuid
 
 import pygame as pg
 
-from . import events
+from . import events, pointer
 from .widget import SingleChildContainerWidget, Widget
 
 
 class Button(SingleChildContainerWidget):
+    layout_state_attributes = ()
+
     def __init__(self,
                  child: Widget,
                  *,
@@ -26,25 +28,30 @@ class Button(SingleChildContainerWidget):
         self._use_mask = use_mask
 
         events.register_handler(pg.MOUSEBUTTONDOWN, self._click_handler)
-        events.register_handler(pg.MOUSEMOTION, self._mouse_motion_handler)
-
-    def _mouse_motion_handler(self, event: pg.event.Event) -> None:
-        mouse_inside = self.rect.collidepoint(event.pos)
 
         if self._on_hover is not None:
-            if mouse_inside and not self._last_hovered and self._on_hover is not None:
-                self._on_hover(self, True)
-            elif not mouse_inside and self._last_hovered:
-                self._on_hover(self, False)
+            pointer.register_hover_target(self)
+
+    def set_hovered(self, is_hovered: bool) -> None:
+        if is_hovered != self._last_hovered and self._on_hover is not None:
+            self._on_hover(self, is_hovered)
 
-        self._last_hovered = mouse_inside
+        self._last_hovered = is_hovered
 
     def _click_handler(self, event: pg.event.Event) -> None:
+        # make sure hover state is up to date before the click is handled
+        pointer.flush()
+
         collided = self.rect.collidepoint(event.pos)
 
         if collided and self._on_click is not None:
             self._on_click(self, event)
 
+    def update(self, *args: t.Any, **kwargs: t.Any) -> None:
+        pointer.flush()
+
+        super().update(*args, **kwargs)
+
     def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
         super().calculate_size(max_width, max_height)
 
@@ -3,7 +3,7 @@ import uuid
 
 import pygame as pg
 
-from guinea import _internal
+from guinea import _internal, surface_pool
 from guinea._internal import TargetFill
 from guinea.enums import HAlignment, VAlignment
 from guinea.widget import ContainerWidget, Widget
@@ -47,6 +47,10 @@ class PaddingValue:
 
 
 class Container(ContainerWidget):
+    supports_threaded_redraw = True
+    supports_scheduled_redraw = True
+    layout_state_attributes = ()
+
     def __init__(self,
                  child: Widget | None = None,
                  *,
@@ -71,7 +75,7 @@ class Container(ContainerWidget):
 
         self.visible = bg is not None
 
-        self.image = pg.Surface((0, 0))
+        self.image = surface_pool.get_empty()
 
     @property
     def child(self) -> Widget | None:
@@ -134,41 +138,50 @@ class Container(ContainerWidget):
 
         return self.rect.size
 
+    def can_draw_into(self) -> bool:
+        return isinstance(self.bg, pg.Color) and self.bg.a == 255 and self.rounding == -1
+
+    def draw_into(self, target: pg.Surface) -> None:
+        assert isinstance(self.bg, pg.Color)
+        target.fill(self.bg)
+
     def redraw(self) -> None:
+        self.replace_image(self.render_image())
+
+    def render_image(self) -> pg.Surface:
         if self.bg is None:
-            self.image = pg.Surface((0, 0))
-            return
+            return surface_pool.get_empty()
 
         is_rounded = self.rounding != -1
 
         surface_flags = _internal.get_surface_flags_for_target_fill(self.bg) | (pg.SRCALPHA if is_rounded else 0)
-        self.image = pg.Surface(
-            self.rect.size,
-            surface_flags)
+        img = surface_pool.acquire(self.rect.size, surface_flags)
 
         if isinstance(self.bg, pg.Color):
-            pg.draw.rect(self.image, self.bg, self.image.get_rect(), border_radius=self.rounding)
+            pg.draw.rect(img, self.bg, img.get_rect(), border_radius=self.rounding)
         elif isinstance(self.bg, pg.Surface):
             if self.rounding == -1:
                 pg.transform.smoothscale(
                     self.bg,
-                    self.image.get_size(),
-                    self.image)
+                    img.get_size(),
+                    img)
             else:
                 pg.draw.rect(
-                    self.image,
+                    img,
                     (255, 255, 255, 255),
-                    self.image.get_rect(),
+                    img.get_rect(),
                     border_radius=self.rounding)
-                self.image.blit(
-                    pg.transform.smoothscale(self.bg, self.image.get_size()),
+                img.blit(
+                    pg.transform.smoothscale(self.bg, img.get_size()),
                     (0, 0),
                     special_flags=pg.BLEND_RGBA_MIN)
         else: # isinstance(self.bg, Shader)
             if is_rounded:
                 pg.draw.rect(
-                    self.image,
+                    img,
                     (255, 255, 255, 255),
-                    self.image.get_rect(),
+                    img.get_rect(),
                     border_radius=self.rounding)
-            self.bg.draw(self.image, is_rounded)
+            self.bg.draw(img, is_rounded)
+
+        return img
@@ -0,0 +1,252 @@
+import collections
+import typing as t
+import uuid
+
+import pygame as pg
+
+from guinea import _internal, events, pointer, surface_pool
+from guinea.enums import TextAlign
+from guinea.widget import Widget
+
+TFormatter = t.Callable[[t.Any], str]
+
+class DataGridColumn:
+    '''
+    Column of a `DataGrid`. `values` can be any indexable sequence
+    (list, NumPy array, memoryview, ...); values are only read when visible.
+    '''
+
+    def __init__(self,
+                 title: str,
+                 values: t.Sequence[t.Any],
+                 width: int,
+                 *,
+                 formatter: TFormatter = str,
+                 align: TextAlign = TextAlign.LEFT) -> None:
+        self.title = title
+        self.values = values
+        self.width = width
+        self.formatter = formatter
+        self.align = align
+
+class DataGrid(Widget):
+    '''
+    Widget displaying table of (possibly very many) rows. Rows have fixed height,
+    so only the visible cells are read, formatted and drawn. Rendered cells are kept
+    in a bounded cache keyed by column, value (and its type) and style. Header row is always visible.
+    '''
+
+    layout_state_attributes = ()
+
+    DEFAULT_FONT_SIZE = 16
+    DEFAULT_FG_COLOR = pg.Color(0, 0, 0, 255)
+    DEFAULT_BG_COLOR = pg.Color(255, 255, 255, 255)
+    DEFAULT_ALT_BG_COLOR = pg.Color(240, 240, 240, 255)
+    DEFAULT_HEADER_FG_COLOR = pg.Color(0, 0, 0, 255)
+    DEFAULT_HEADER_BG_COLOR = pg.Color(200, 200, 200, 255)
+    DEFAULT_CELL_PADDING = 4
+    DEFAULT_CELL_CACHE_SIZE = 4096
+    DEFAULT_SCROLL_STEP = 3
+
+    def __init__(self,
+                 columns: list[DataGridColumn],
+                 *,
+                 fg: pg.Color = DEFAULT_FG_COLOR,
+                 bg: pg.Color = DEFAULT_BG_COLOR,
+                 alt_bg: pg.Color | None = DEFAULT_ALT_BG_COLOR,
+                 header_fg: pg.Color = DEFAULT_HEADER_FG_COLOR,
+                 header_bg: pg.Color = DEFAULT_HEADER_BG_COLOR,
+                 grid_color: pg.Color | None = None,
+                 font: pg.font.Font | None = None,
+                 antialiasing: bool = True,
+                 cell_padding: int = DEFAULT_CELL_PADDING,
+                 cell_cache_size: int = DEFAULT_CELL_CACHE_SIZE,
+                 scroll_step: int = DEFAULT_SCROLL_STEP,
+                 _id: uuid.UUID | None = None,
+                 rect: pg.Rect | None = None) -> None:
+        super().__init__(_id, rect)
+
+        self._fg = fg
+        self._bg = bg
+        self._alt_bg = alt_bg
+        self._header_fg = header_fg
+        self._header_bg = header_bg
+        self._grid_color = grid_color
+        self._font = font or _internal.FontCache.get_default_of_size(DataGrid.DEFAULT_FONT_SIZE)
+        self._antialiasing = antialiasing
+        self._cell_padding = cell_padding
+        self._scroll_step = scroll_step
+
+        self._row_height = self._font.get_height() + 2 * cell_padding
+        self._first_row = 0
+
+        # (column index, value type, value, is alternate row) -> rendered cell, least recently used first
+        self._cell_cache = collections.OrderedDict[tuple[int, type, t.Any, bool], pg.Surface]()
+        self._cell_cache_size = cell_cache_size
+
+        self._columns = list[DataGridColumn]()
+        self._column_offsets = list[int]()
+        self.set_columns(columns)
+
+        self.image = surface_pool.get_empty()
+
+        events.register_handler(pg.MOUSEWHEEL, self._mouse_wheel_handler)
+
+    def set_columns(self, columns: list[DataGridColumn]) -> None:
+        self._columns = columns
+
+        self._column_offsets = list[int]()
+        offset = 0
+        for column in columns:
+            self._column_offsets.append(offset)
+            offset += column.width
+
+        self._cell_cache.clear()
+
+        self.scroll_to(self._first_row)
+        self._needs_redraw = True
+
+    def refresh(self) -> None:
+        '''
+        Redraws the grid after values in the column sources changed.
+        '''
+
+        self._needs_redraw = True
+
+    def scroll_to(self, row: int) -> None:
+        # last row can be scrolled to the bottom edge, but not further
+        fully_visible_rows_count = max(self.rect.height // self._row_height - 1, 0)
+
+        row = max(0, min(row, self.rows_count - fully_visible_rows_count))
+        if row != self._first_row:
+            self._first_row = row
+            self._needs_redraw = True
+
+    def scroll(self, rows: int) -> None:
+        self.scroll_to(self._first_row + rows)
+
+    def get_row_at(self, pos: tuple[int, int]) -> int | None:
+        '''
+        Returns index of the row at given screen position or `None` if there is no row there.
+        '''
+
+        if not self.rect.collidepoint(pos):
+            return None
+
+        y = pos[1] - self.rect.y - self._row_height
+        if y < 0:
+            return None
+
+        row = self._first_row + y // self._row_height
+        return row if row < self.rows_count else None
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
+        self.rect.width = max_width
+        self.rect.height = max_height
+
+        # visible rows count depends on the height
+        self.scroll_to(self._first_row)
+
+        return self.rect.size
+
+    def redraw(self) -> None:
+        if self.image.get_size() != self.rect.size:
+            self.replace_image(surface_pool.acquire(self.rect.size))
+
+        self.image.fill(self._bg)
+
+        row_height = self._row_height
+
+        # header
+        self.image.fill(self._header_bg, pg.Rect(0, 0, self.rect.width, row_height))
+        for column, offset in zip(self._columns, self._column_offsets):
+            with _internal.font_lock:
+                title_surf = self._font.render(column.title, self._antialiasing, self._header_fg, self._header_bg)
+
+            self._blit_cell(title_surf, column, offset, 0)
+
+        # rows are positioned directly from their index, as all rows have the same height
+        last_row = min(self._first_row + self._visible_rows_count, self.rows_count)
+        for row in range(self._first_row, last_row):
+            y = (row - self._first_row + 1) * row_height
+            is_alt_row = self._alt_bg is not None and row % 2 == 1
+
+            if is_alt_row:
+                self.image.fill(self._alt_bg, pg.Rect(0, y, self.rect.width, row_height))
+
+            for i, (column, offset) in enumerate(zip(self._columns, self._column_offsets)):
+                if offset >= self.rect.width:
+                    break
+
+                self._blit_cell(self._get_cell(i, column.values[row], is_alt_row), column, offset, y)
+
+        if self._grid_color is not None:
+            for offset in self._column_offsets[1:]:
+                pg.draw.line(self.image, self._grid_color, (offset, 0), (offset, self.rect.height))
+
+            pg.draw.line(self.image, self._grid_color, (0, row_height - 1), (self.rect.width, row_height - 1))
+
+    def _get_cell(self, column_index: int, value: t.Any, is_alt_row: bool) -> pg.Surface:
+        # values of different types can compare equal (`1 == 1.0 == True`), but are formatted differently
+        key = (column_index, type(value), value, is_alt_row)
+
+        try:
+            cell = self._cell_cache.get(key)
+        except TypeError:
+            # unhashable values are not cached
+            return self._render_cell(column_index, value, is_alt_row)
+
+        if cell is not None:
+            self._cell_cache.move_to_end(key)
+            return cell
+
+        cell = self._render_cell(column_index, value, is_alt_row)
+
+        self._cell_cache[key] = cell
+        if len(self._cell_cache) > self._cell_cache_size:
+            self._cell_cache.popitem(last=False)
+
+        return cell
+
+    def _render_cell(self, column_index: int, value: t.Any, is_alt_row: bool) -> pg.Surface:
+        text = self._columns[column_index].formatter(value)
+        bg = self._alt_bg if is_alt_row else self._bg
+
+        with _internal.font_lock:
+            return self._font.render(text, self._antialiasing, self._fg, bg)
+
+    def _blit_cell(self, cell: pg.Surface, column: DataGridColumn, offset: int, y: int) -> None:
+        available_width = column.width - 2 * self._cell_padding
+
+        x = self._cell_padding
+        if column.align == TextAlign.RIGHT:
+            x += max(available_width - cell.get_width(), 0)
+        elif column.align == TextAlign.CENTER:
+            x += max(_internal.divide_with_overflow(available_width - cell.get_width(), 2), 0)
+
+        self.image.blit(
+            cell,
+            (offset + x, y + self._cell_padding),
+            pg.Rect(0, 0, available_width, cell.get_height()))
+
+    def _mouse_wheel_handler(self, event: pg.event.Event) -> None:
+        if self.rect.collidepoint(pointer.get_pos()):
+            self.scroll(-event.y * self._scroll_step)
+
+    @property
+    def _visible_rows_count(self) -> int:
+        return max(-(-self.rect.height // self._row_height) - 1, 0)
+
+    @property
+    def rows_count(self) -> int:
+        return min((len(column.values) for column in self._columns), default=0)
+
+    @property
+    def first_row(self) -> int:
+        return self._first_row
+
+    @property
+    def row_height(self) -> int:
+        return self._row_height
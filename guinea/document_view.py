@@ -0,0 +1,224 @@
+import array
+import mmap
+import os
+import threading
+import typing as t
+import uuid
+
+import pygame as pg
+
+from guinea import _internal, events, pointer, surface_pool
+from guinea.widget import Widget
+
+# offset of every n-th line is stored in the index, other lines are found by scanning from it
+INDEX_STRIDE = 256
+# lines longer than this are cut, as they would not fit on the screen anyway
+MAX_LINE_BYTES = 4096
+
+class DocumentView(Widget):
+    '''
+    Widget displaying (possibly very large) text file. The file is memory-mapped and
+    only lines inside the viewport are decoded and rendered. Line index is built
+    in the background, so the beginning of the file can be shown right away.
+    '''
+
+    layout_state_attributes = ()
+
+    DEFAULT_FONT_SIZE = 16
+    DEFAULT_FG_COLOR = pg.Color(0, 0, 0, 255)
+    DEFAULT_BG_COLOR = pg.Color(255, 255, 255, 255)
+    DEFAULT_SCROLL_STEP = 3
+
+    def __init__(self,
+                 filepath: str | os.PathLike[str],
+                 *,
+                 encoding: str = 'utf-8',
+                 fg: pg.Color = DEFAULT_FG_COLOR,
+                 bg: pg.Color = DEFAULT_BG_COLOR,
+                 font: pg.font.Font | None = None,
+                 antialiasing: bool = True,
+                 line_spacing: int = 0,
+                 tab_size: int = 4,
+                 scroll_step: int = DEFAULT_SCROLL_STEP,
+                 _id: uuid.UUID | None = None,
+                 rect: pg.Rect | None = None) -> None:
+        super().__init__(_id, rect)
+
+        self._encoding = encoding
+        self._fg = fg
+        self._bg = bg
+        self._font = font or _internal.FontCache.get_default_of_size(DocumentView.DEFAULT_FONT_SIZE)
+        self._antialiasing = antialiasing
+        self._line_spacing = line_spacing
+        self._tab_size = tab_size
+        self._scroll_step = scroll_step
+
+        self._file = open(filepath, 'rb')
+        self._mmap: mmap.mmap | None = None
+        if os.fstat(self._file.fileno()).st_size != 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._index_lock = threading.Lock()
+        self._checkpoints = array.array('Q', [0])
+        self._lines_count = 0
+        self._is_indexed = self._mmap is None
+
+        self._first_line = 0
+        self._drawn_lines_count = 0
+        self._drawn_all_lines = False
+
+        self.image = surface_pool.get_empty()
+
+        self._stop_indexing = threading.Event()
+        self._index_thread: threading.Thread | None = None
+        if self._mmap is not None:
+            self._index_thread = threading.Thread(
+                target=self._build_index,
+                name='guinea-document-index',
+                daemon=True)
+            self._index_thread.start()
+
+        events.register_handler(pg.MOUSEWHEEL, self._mouse_wheel_handler)
+
+    def close(self) -> None:
+        self._stop_indexing.set()
+        if self._index_thread is not None:
+            self._index_thread.join()
+            self._index_thread = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        self._file.close()
+
+    def kill(self) -> None:
+        self.close()
+
+        super().kill()
+
+    def scroll_to(self, line: int) -> None:
+        line = max(0, min(line, self.lines_count - 1))
+        if line != self._first_line:
+            self._first_line = line
+            self._needs_redraw = True
+
+    def scroll(self, lines: int) -> None:
+        self.scroll_to(self._first_line + lines)
+
+    def update(self, *args: t.Any, **kwargs: t.Any) -> None:
+        # viewport was not filled at the last redraw, but more lines could be known now
+        if self._drawn_lines_count < self._visible_lines_count and not self._drawn_all_lines:
+            self._needs_redraw = True
+
+        super().update(*args, **kwargs)
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
+        self.rect.width = max_width
+        self.rect.height = max_height
+
+        return self.rect.size
+
+    def redraw(self) -> None:
+        self._drawn_all_lines = self._is_indexed
+
+        if self.image.get_size() != self.rect.size:
+            self.replace_image(surface_pool.acquire(self.rect.size))
+
+        self.image.fill(self._bg)
+
+        line_height = self._font.get_height() + self._line_spacing
+        lines = self._read_lines(self._first_line, self._visible_lines_count)
+
+        with _internal.font_lock:
+            for i, line in enumerate(lines):
+                line_surf = self._font.render(line, self._antialiasing, self._fg, self._bg)
+                self.image.blit(line_surf, (0, i * line_height))
+
+        self._drawn_lines_count = len(lines)
+
+    def _mouse_wheel_handler(self, event: pg.event.Event) -> None:
+        if self.rect.collidepoint(pointer.get_pos()):
+            self.scroll(-event.y * self._scroll_step)
+
+    def _read_lines(self, first: int, count: int) -> list[str]:
+        mm = self._mmap
+        if mm is None:
+            return []
+
+        checkpoint = first // INDEX_STRIDE
+        with self._index_lock:
+            if checkpoint >= len(self._checkpoints):
+                return []
+
+            pos = self._checkpoints[checkpoint]
+
+        size = len(mm)
+
+        # skip to the first requested line
+        for _ in range(first % INDEX_STRIDE):
+            newline = mm.find(b'\n', pos)
+            if newline == -1:
+                return []
+
+            pos = newline + 1
+
+        lines = list[str]()
+        while len(lines) < count and pos < size:
+            newline = mm.find(b'\n', pos)
+            end = size if newline == -1 else newline
+
+            line = mm[pos:min(end, pos + MAX_LINE_BYTES)].decode(self._encoding, errors='replace')
+            lines.append(line.rstrip('\r').replace('\t', ' ' * self._tab_size))
+
+            pos = end + 1
+
+        return lines
+
+    def _build_index(self) -> None:
+        mm = self._mmap
+        assert mm is not None
+
+        size = len(mm)
+        pos = 0
+        line = 0
+
+        while pos < size and not self._stop_indexing.is_set():
+            newline = mm.find(b'\n', pos)
+            line += 1
+            if newline == -1:
+                break
+
+            pos = newline + 1
+
+            if line % INDEX_STRIDE == 0 and pos < size:
+                with self._index_lock:
+                    self._checkpoints.append(pos)
+
+                self._lines_count = line
+
+        self._lines_count = line
+        self._is_indexed = True
+
+    @property
+    def _visible_lines_count(self) -> int:
+        line_height = self._font.get_height() + self._line_spacing
+        return -(-self.rect.height // line_height)
+
+    @property
+    def lines_count(self) -> int:
+        '''
+        Number of lines indexed so far.
+        '''
+
+        return self._lines_count
+
+    @property
+    def is_indexed(self) -> bool:
+        return self._is_indexed
+
+    @property
+    def first_line(self) -> int:
+        return self._first_line
@@ -22,6 +22,7 @@ class HAlignment(enum.IntEnum):
 class MainAxisSize(enum.IntEnum):
     MIN = enum.auto()
     EVEN = enum.auto()
+    FLEX = enum.auto()
 
 class ImageFilter(enum.IntEnum):
     NEAREST = enum.auto()
@@ -46,10 +47,14 @@ class TextFit(enum.IntEnum):
     '''
     An enum used in `Text.__init__(fit)`.
     Determines if text widget should attempt to fit the
-    text if it doesn't fit inside.
+    text if it doesn't fit inside. `WRAP` breaks lines
+    at spaces to fit the available width and crops the rest.
+    `FIT_FONT` renders text with the largest font size that fits.
     '''
     FIT = enum.auto()
     CROP = enum.auto()
+    WRAP = enum.auto()
+    FIT_FONT = enum.auto()
 
 class Direction(enum.IntEnum):
     LEFT = enum.auto()
@@ -1,19 +1,173 @@
+import types
 import typing as t
 from collections import defaultdict
 
 import pygame as pg
 
-THandler = t.Callable[[pg.event.Event], None]
+from guinea import _internal
 
-def process_event(event: pg.event.Event) -> None:
-    for handler in _handlers[event.type]:
-        handler(event)
+THandler = t.Callable[[pg.event.Event], bool | None]
+THandlerRef = t.Callable[[], THandler | None]
 
-def register_handler(event_type: int, handler: THandler) -> None:
-    _handlers[event_type].add(handler)
+DEFAULT_PRIORITY = 0
 
-def unregister_handler(handler: THandler) -> None:
-    for _type in _handlers:
-        _handlers[_type].remove(handler)
+def process_event(event: pg.event.Event) -> bool:
+    '''
+    Dispatches single event to registered handlers, in order of descending priority.
+    A handler may return `True` to stop the event from propagating to the remaining handlers.
+    Returns `True` if propagation was stopped.
+    '''
 
-_handlers = defaultdict[int, set[THandler]](set)
+    for handler_ref in _routes.get(event.type, ()):
+        handler = handler_ref()
+        if handler is not None and handler(event):
+            return True
+
+    return False
+
+def process_events(events: t.Iterable[pg.event.Event] | None = None) -> None:
+    '''
+    Dispatches a batch of events. Events of types without any handler are skipped
+    and consecutive events of the same type share a single routing table lookup
+    (unless handlers are registered or unregistered by one of them).
+    Relative order of events is preserved.
+
+    If `events` is `None`, only events of handled types are taken from the pygame event queue
+    (using `pg.event.get(eventtype=...)`). Other events are left in the queue and the application
+    is responsible for getting or clearing them.
+
+    Pointer motion accumulated during the batch is flushed at the end.
+    '''
+
+    from guinea import pointer
+
+    if events is None:
+        if len(_routes) == 0:
+            return
+
+        events = pg.event.get(eventtype=get_handled_event_types())
+
+    routes = _routes
+    current_type = -1
+    routes_version = -1
+    handler_refs: tuple[THandlerRef, ...] = ()
+
+    for event in events:
+        # handlers (un)registered by a previous event apply to the following ones
+        if event.type != current_type or _routes_version != routes_version:
+            current_type = event.type
+            routes_version = _routes_version
+            handler_refs = routes.get(current_type, ())
+
+        for handler_ref in handler_refs:
+            handler = handler_ref()
+            if handler is not None and handler(event):
+                break
+
+    pointer.flush()
+
+def get_handled_event_types() -> list[int]:
+    return list(_routes)
+
+def get_handler_count(event_type: int) -> int:
+    return len(_routes.get(event_type, ()))
+
+def get_handler_counts() -> dict[int, int]:
+    return {_type: len(handler_refs) for _type, handler_refs in _routes.items()}
+
+def register_handler(event_type: int, handler: THandler, priority: int = DEFAULT_PRIORITY) -> None:
+    '''
+    Registers handler for given event type. Bound methods are held weakly, so registering
+    a widget's method does not keep the widget alive. Other callables are held strongly.
+    '''
+
+    global _registration_counter
+
+    entries = _handlers[event_type]
+    if any(entry[2]() == handler for entry in entries):
+        return
+
+    owner = _get_owner(handler)
+
+    handler_ref = _internal.make_callback_ref(handler, lambda: _remove_dead_handlers(event_type))
+
+    _registration_counter += 1
+
+    entries.append((-priority, _registration_counter, handler_ref, owner))
+    entries.sort(key=lambda x: (x[0], x[1]))
+
+    if owner is not None:
+        _owner_event_types[owner].add(event_type)
+
+    _rebuild_route(event_type)
+
+def unregister_handler(handler: THandler, event_type: int | None = None) -> None:
+    '''
+    Unregisters handler from given event type or from all event types if `event_type` is `None`.
+    Handlers which were not registered are ignored.
+    '''
+
+    _types = list(_handlers) if event_type is None else [event_type]
+    for _type in _types:
+        if _type not in _handlers:
+            continue
+
+        _handlers[_type] = [entry for entry in _handlers[_type] if entry[2]() != handler]
+        _rebuild_route(_type)
+
+def unregister_owner(owner: object) -> None:
+    '''
+    Unregisters all handlers which are methods bound to `owner`.
+    '''
+
+    owner_id = id(owner)
+    for _type in _owner_event_types.pop(owner_id, ()):
+        if _type not in _handlers:
+            continue
+
+        _handlers[_type] = [entry for entry in _handlers[_type] if entry[3] != owner_id]
+        _rebuild_route(_type)
+
+def _get_owner(handler: THandler) -> int | None:
+    if isinstance(handler, types.MethodType):
+        return id(handler.__self__)
+
+    return None
+
+def _remove_dead_handlers(event_type: int) -> None:
+    if event_type not in _handlers:
+        return
+
+    alive = list[tuple[int, int, THandlerRef, int | None]]()
+    for entry in _handlers[event_type]:
+        if entry[2]() is not None:
+            alive.append(entry)
+        elif entry[3] is not None:
+            _owner_event_types.pop(entry[3], None)
+
+    _handlers[event_type] = alive
+    _rebuild_route(event_type)
+
+def _rebuild_route(event_type: int) -> None:
+    global _routes_version
+
+    _routes_version += 1
+
+    entries = _handlers[event_type]
+    if len(entries) == 0:
+        del _handlers[event_type]
+        _routes.pop(event_type, None)
+        return
+
+    # routes are immutable snapshots, so handlers can be (un)registered during dispatch
+    _routes[event_type] = tuple(entry[2] for entry in entries)
+
+_registration_counter = 0
+
+# entries are kept as (-priority, registration order, handler ref, owner id) sorted in dispatch order
+_handlers = defaultdict[int, list[tuple[int, int, THandlerRef, int | None]]](list)
+_routes = dict[int, tuple[THandlerRef, ...]]()
+
+# incremented whenever any route changes
+_routes_version = 0
+_owner_event_types = defaultdict[int, set[int]](set)
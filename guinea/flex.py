@@ -0,0 +1,107 @@
+import math
+import uuid
+
+import pygame as pg
+
+from guinea.widget import SingleChildContainerWidget, Widget
+
+
+class Flex(SingleChildContainerWidget):
+    '''
+    Wrapper which makes its child flexible in a `Row` or `Column` using `MainAxisSize.FLEX`.
+    Space left after laying out other children is shared between flexible children
+    in proportion to their `flex` factors, respecting their `min_size` and `max_size`
+    along the main axis. The child is laid out in the whole space given to the wrapper.
+    '''
+
+    layout_state_attributes = ()
+
+    def __init__(self,
+                 child: Widget,
+                 flex: float = 1.0,
+                 *,
+                 min_size: int = 0,
+                 max_size: int | None = None,
+                 _id: uuid.UUID | None = None,
+                 rect: pg.Rect | None = None) -> None:
+        super().__init__(child, _id, rect)
+
+        assert flex >= 0, 'Flex factor cannot be negative'
+        assert max_size is None or max_size >= min_size, 'Maximum size cannot be lower than minimum size'
+
+        self.flex = flex
+        self.min_size = min_size
+        self.max_size = max_size
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
+        self.child.calculate_size(max_width, max_height)
+
+        self.rect.width = max_width
+        self.rect.height = max_height
+
+        return self.rect.size
+
+    def set_placement(self, x: int, y: int) -> None:
+        super().set_placement(x, y)
+
+        self.child.set_placement(x, y)
+
+def distribute_flex_space(space: int, items: list[tuple[float, int, int | None]]) -> list[int]:
+    '''
+    Distributes `space` between items given as `(flex, min_size, max_size)`.
+
+    Size of every item is `clamp(flex * x, min_size, max_size)` for a single `x`, chosen so
+    that the sizes sum up to `space` (if constraints allow it). Total size is a piecewise linear
+    function of `x` with breakpoints where items reach their limits, so `x` is found by a single
+    sweep over the sorted breakpoints. Sizes are rounded so that they sum up exactly.
+    '''
+
+    total_min_size = sum(min_size for _, min_size, _ in items)
+    if space <= total_min_size:
+        return [min_size for _, min_size, _ in items]
+
+    # (x, change of slope) at which items start and stop growing
+    breakpoints = list[tuple[float, float]]()
+    for flex, min_size, max_size in items:
+        if flex == 0:
+            continue
+
+        breakpoints.append((min_size / flex, flex))
+        if max_size is not None:
+            breakpoints.append((max_size / flex, -flex))
+
+    breakpoints.sort()
+
+    x = 0.0
+    total_size = float(total_min_size)
+    slope = 0.0
+    for breakpoint_x, slope_change in breakpoints:
+        next_total_size = total_size + slope * (breakpoint_x - x)
+        if slope > 0 and next_total_size >= space:
+            break
+
+        total_size = next_total_size
+        x = breakpoint_x
+        slope += slope_change
+
+    if slope > 0:
+        x += (space - total_size) / slope
+
+    sizes = list[int]()
+    cumulative_size = 0.0
+    rounded_cumulative_size = 0
+    for flex, min_size, max_size in items:
+        size = max(flex * x, min_size)
+        if max_size is not None:
+            size = min(size, max_size)
+
+        # rounding cumulative sizes keeps the total exact (and integral sizes unchanged)
+        cumulative_size += size
+        next_rounded_cumulative_size = math.floor(cumulative_size + 1e-9)
+
+        sizes.append(next_rounded_cumulative_size - rounded_cumulative_size)
+        rounded_cumulative_size = next_rounded_cumulative_size
+
+    return sizes
@@ -7,6 +7,8 @@ from guinea.widget import SingleChildContainerWidget, Widget
 
 
 class Fraction(SingleChildContainerWidget):
+    layout_state_attributes = ()
+
     def __init__(self,
                  child: Widget,
                  factor: tuple[float, float],
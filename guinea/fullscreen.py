@@ -1,3 +1,5 @@
+import time
+import typing as t
 import uuid
 
 import pygame as pg
@@ -9,9 +11,12 @@ from .widget import SingleChildContainerWidget, Widget
 
 
 class Fullscreen(SingleChildContainerWidget):
+    layout_state_attributes = ()
+
     def __init__(self,
                  child: Widget,
                  *,
+                 resize_debounce: float = 0.0,
                  _id: uuid.UUID | None = None) -> None:
         display_size = pg.display.get_surface().get_size()
 
@@ -20,14 +25,29 @@ class Fullscreen(SingleChildContainerWidget):
             _id,
             pg.Rect((0, 0), display_size))
 
+        # resize requests are only recorded here and applied at most once per update, after
+        # no new request arrived for `resize_debounce` seconds
+        self._resize_debounce = resize_debounce
+        self._pending_size: tuple[int, int] | None = None
+        self._last_resize_time = 0.0
+
         events.register_handler(pg.VIDEORESIZE, self._handle_video_resize)
 
     def _handle_video_resize(self, event: pg.event.Event) -> None:
-        self.rect.width = event.w
-        self.rect.height = event.h
+        self._pending_size = (event.w, event.h)
+        self._last_resize_time = time.perf_counter()
+
+    def update(self, *args: t.Any, **kwargs: t.Any) -> None:
+        if self._pending_size is not None and time.perf_counter() - self._last_resize_time >= self._resize_debounce:
+            if self._pending_size != self.rect.size:
+                self.rect.size = self._pending_size
+
+                self._needs_recalculate = True
+                self._needs_reposition = True
+
+            self._pending_size = None
 
-        self._needs_recalculate = True
-        self._needs_reposition = True
+        super().update(*args, **kwargs)
 
     def set_parent(self, _: ContainerWidget) -> None:
         raise RuntimeError('Fullscreen widget can only be used as a top-level widget. It\'s parent cannot be set.')
@@ -0,0 +1,91 @@
+import uuid
+
+import numpy as np
+import pygame as pg
+
+from guinea import _internal
+from guinea.widget import ContainerWidget, Widget
+
+
+class Grid(ContainerWidget):
+    '''
+    Container laying out its children in cells of a grid, in row-major order.
+    Every column is as wide as its widest cell and every row is as high as its highest cell,
+    so cells line up along both axes. Each child is measured within an equal share of the space.
+
+    Track sizes and offsets are computed with NumPy (which is an optional dependency, see `guinea[grid]`).
+    '''
+
+    layout_state_attributes = ('_cell_offsets',)
+
+    def __init__(self,
+                 children: list[Widget],
+                 columns: int,
+                 *,
+                 column_spacing: int = 0,
+                 row_spacing: int = 0,
+                 _id: uuid.UUID | None = None,
+                 rect: pg.Rect | None = None) -> None:
+        super().__init__(children, _id, rect)
+
+        assert columns > 0, 'Grid has to have at least one column'
+
+        self._columns = columns
+        self._column_spacing = column_spacing
+        self._row_spacing = row_spacing
+
+        # position of every cell relative to the grid, computed by `calculate_size`
+        self._cell_offsets = list[tuple[int, int]]()
+
+    @property
+    def columns(self) -> int:
+        return self._columns
+
+    @property
+    def rows(self) -> int:
+        return -(-self.children_count // self._columns)
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
+        rows = self.rows
+        if rows == 0:
+            self._cell_offsets = []
+            self.rect.size = (0, 0)
+            return self.rect.size
+
+        cell_max_width = _internal.divide_with_overflow(max_width - self._column_spacing * (self._columns - 1), self._columns)
+        cell_max_height = _internal.divide_with_overflow(max_height - self._row_spacing * (rows - 1), rows)
+
+        # intrinsic sizes of cells, the last row is padded with empty cells
+        sizes = np.zeros((rows * self._columns, 2), dtype=np.int64)
+        sizes[:self.children_count] = [
+            child.calculate_size(cell_max_width, cell_max_height)
+            for child in self._children]
+        sizes = sizes.reshape(rows, self._columns, 2)
+
+        column_widths = sizes[:, :, 0].max(axis=0)
+        row_heights = sizes[:, :, 1].max(axis=1)
+
+        # offsets of tracks are cumulative sums of preceding tracks and spacings
+        column_offsets = np.zeros(self._columns, dtype=np.int64)
+        np.cumsum(column_widths[:-1] + self._column_spacing, out=column_offsets[1:])
+
+        row_offsets = np.zeros(rows, dtype=np.int64)
+        np.cumsum(row_heights[:-1] + self._row_spacing, out=row_offsets[1:])
+
+        cells = np.arange(self.children_count)
+        self._cell_offsets = list(zip(
+            column_offsets[cells % self._columns].tolist(),
+            row_offsets[cells // self._columns].tolist()))
+
+        self.rect.width = int(column_offsets[-1] + column_widths[-1])
+        self.rect.height = int(row_offsets[-1] + row_heights[-1])
+
+        return self.rect.size
+
+    def set_placement(self, x: int, y: int) -> None:
+        super().set_placement(x, y)
+
+        for child, (offset_x, offset_y) in zip(self._children, self._cell_offsets):
+            child.set_placement(x + offset_x, y + offset_y)
@@ -1,13 +1,20 @@
+import time
 import typing as t
 import uuid
 
 import pygame as pg
 
+from guinea import _internal
 from guinea.enums import ImageFilter
 from guinea.widget import Widget
 
 
 class Image(Widget):
+    supports_threaded_redraw = True
+    layout_state_attributes = ('_target_size', '_is_laid_out')
+
+    DEFAULT_SETTLE_TIME = 0.15
+
     @classmethod
     def from_file(cls,
                   filepath: str,
@@ -15,20 +22,21 @@ class Image(Widget):
                   filter: ImageFilter = ImageFilter.LINEAR,
                   preserve_ratio: bool = False,
                   rounding: int = 0,
+                  progressive: bool = False,
+                  settle_time: float = DEFAULT_SETTLE_TIME,
                   _id: uuid.UUID | None = None,
                   rect: pg.Rect | None = None) -> t.Self:
-        img = pg.image.load(filepath)
-
-        if img.get_bytesize() == 4:
-            img = img.convert_alpha()
-        else:
-            img = img.convert()
+        # images are shared through the cache (which can be warmed up, see `guinea.offline`),
+        # the original image is never modified
+        img = _internal._ImageCache.try_get_image(filepath, False)
 
         return cls(
             img,
             filter=filter,
             preserve_ratio=preserve_ratio,
             rounding=rounding,
+            progressive=progressive,
+            settle_time=settle_time,
             _id=_id,
             rect=rect)
 
@@ -38,6 +46,8 @@ class Image(Widget):
                  filter: ImageFilter = ImageFilter.LINEAR,
                  preserve_ratio: bool = False,
                  rounding: int = 0,
+                 progressive: bool = False,
+                 settle_time: float = DEFAULT_SETTLE_TIME,
                  _id: uuid.UUID | None = None,
                  rect: pg.Rect | None = None) -> None:
         super().__init__(_id, rect)
@@ -46,45 +56,92 @@ class Image(Widget):
         self._preserve_aspect_ratio = preserve_ratio
         self._original_image = img
         self._rounding = rounding
+        self._target_size = img.get_size()
+
+        # when progressive, image is scaled with fast (low quality) filter while its size
+        # keeps changing and then smoothscaled once, after the size has settled
+        self._progressive = progressive
+        self._settle_time = settle_time
+        self._is_resizing = False
+        self._is_laid_out = False
+        self._last_resize_time = 0.0
+        self._resize_source: pg.Surface | None = None
 
         self.image = img
 
+    def update(self, *args: t.Any, **kwargs: t.Any) -> None:
+        if self._is_resizing and time.perf_counter() - self._last_resize_time >= self._settle_time:
+            self._is_resizing = False
+            self._resize_source = None
+            self._needs_redraw = True
+
+        super().update(*args, **kwargs)
+
     def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
         super().calculate_size(max_width, max_height)
 
+        new_size = self._original_image.get_size()
         if self._original_image.get_width() > max_width or self._original_image.get_height() > max_height:
-            new_size: tuple[int, int]
-
             if self._preserve_aspect_ratio:
                 new_size = _get_scale_aspect_ratio(self._original_image, max_width, max_height)
             else:
                 new_size = _get_scale(self._original_image, max_width, max_height)
 
+        if new_size != self._target_size:
+            self._target_size = new_size
+            self._needs_redraw = True
+
+            if self._progressive and self._is_laid_out and self._filter == ImageFilter.LINEAR:
+                if not self._is_resizing:
+                    # last high quality image is a cheaper and smoother source than the original
+                    self._is_resizing = True
+                    self._resize_source = self.image
+
+                self._last_resize_time = time.perf_counter()
+
+        self._is_laid_out = True
+
+        self.rect.size = new_size
+        return self.rect.size
+
+    def redraw(self) -> None:
+        self.image = self.render_image()
+
+    def render_image(self) -> pg.Surface:
+        img = self._original_image
+        if self._is_resizing:
+            img = pg.transform.scale(_get_resize_source(img, self._resize_source, self._target_size), self._target_size)
+        elif img.get_size() != self._target_size:
             if self._filter == ImageFilter.LINEAR:
-                self.image = pg.transform.smoothscale(self._original_image, new_size)
+                img = pg.transform.smoothscale(img, self._target_size)
             else:
-                self.image = pg.transform.scale(self._original_image, new_size)
+                img = pg.transform.scale(img, self._target_size)
 
         if self._rounding != 0:
-            dst_surf = pg.Surface(self.image.get_size(), pg.SRCALPHA)
+            dst_surf = pg.Surface(img.get_size(), pg.SRCALPHA)
             pg.draw.rect(
                 dst_surf,
                 (255, 255, 255, 255),
-                pg.Rect(0, 0, self.image.get_width(), self.image.get_height()),
+                pg.Rect(0, 0, img.get_width(), img.get_height()),
                 border_radius=self._rounding)
-            dst_surf.blit(self.image, (0, 0), special_flags=pg.BLEND_RGBA_MIN)
+            dst_surf.blit(img, (0, 0), special_flags=pg.BLEND_RGBA_MIN)
 
-            self.image = dst_surf
+            img = dst_surf
 
-        self.rect.size = self.image.get_size()
-        return self.rect.size
+        return img
+
+def _get_resize_source(original: pg.Surface, cached: pg.Surface | None, size: tuple[int, int]) -> pg.Surface:
+    if cached is None or cached.get_width() < size[0] or cached.get_height() < size[1]:
+        return original
+
+    return cached
 
 def _get_scale_aspect_ratio(img: pg.Surface, width: int, height: int) -> tuple[int, int]:
     width_ratio = width / img.get_width()
     height_ratio = height / img.get_height()
     ratio = min(width_ratio, height_ratio)
 
-    return (img.get_width() * ratio, img.get_height() * ratio)
+    return (int(img.get_width() * ratio), int(img.get_height() * ratio))
 
 def _get_scale(img: pg.Surface, width: int, height: int) -> tuple[int, int]:
     return (
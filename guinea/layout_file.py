@@ -0,0 +1,429 @@
+'''
+Loading widget trees from declarative layout files.
+
+Layout file is a JSON document, in which every widget is an object with `type`
+(name of the widget class) and properties matching keyword arguments of the
+widget constructor. Children are given as nested objects (`child`) or lists
+of objects (`children`). Values are converted according to the constructor
+annotations: colors as `[r, g, b(, a)]` lists or strings, rects as `[x, y, w, h]`,
+enum members by name, fonts as `[name, size]`, surfaces as image file paths
+and callbacks by name (looked up in `callbacks` given to `load_layout`).
+Optional `name` makes the widget accessible through `Layout`.
+
+    {
+        "type": "Column",
+        "spacing": 4,
+        "children": [
+            {"type": "Text", "name": "title", "text": "Hello", "fit": "WRAP"},
+            {"type": "ProgressBar", "start_value": 0, "max_value": 10}
+        ]
+    }
+
+Parsed files can be cached in a compiled (pickled) form, together with the results
+of the first layout pass for given root sizes. Cache is validated against the
+modification time and contents of the source file. Cached layouts are also keyed by
+the global overflow behavior and by the files the used fonts resolve to.
+'''
+
+import collections.abc
+import enum
+import hashlib
+import json
+import os
+import pickle
+import types
+import typing as t
+import uuid
+
+import pygame as pg
+
+from guinea import _internal
+from guinea.enums import OverflowBehavior
+from guinea.align import Align, Center
+from guinea.button import Button
+from guinea.column import Column
+from guinea.container import Container, PaddingValue
+from guinea.document_view import DocumentView
+from guinea.flex import Flex
+from guinea.fraction import Fraction
+from guinea.fullscreen import Fullscreen
+from guinea.image import Image
+from guinea.log_view import LogView
+from guinea.progress_bar import ProgressBar
+from guinea.row import Row
+from guinea.scroll_view import ScrollView
+from guinea.stack import Stack
+from guinea.text import Text
+from guinea.widget import ContainerWidget, Widget
+from guinea.window import Window
+
+# bumped whenever the compiled format changes
+CACHE_VERSION = 3
+
+_TLayoutState = tuple[tuple[int, int, int, int], tuple[t.Any, ...]]
+
+# root size, overflow behavior and font files (by font name) the layout was calculated with
+_TLayoutKey = tuple[tuple[int, int], OverflowBehavior, tuple[tuple[str, str | None], ...]]
+
+class Layout:
+    '''
+    Widget tree loaded from a layout file.
+    '''
+
+    def __init__(self, root: Widget, widgets: dict[str, Widget]) -> None:
+        self.root = root
+        self.widgets = widgets
+
+    def __getitem__(self, name: str) -> Widget:
+        return self.widgets[name]
+
+def register_widget_type(widget_type: type[Widget], name: str | None = None) -> None:
+    '''
+    Makes widget type usable in layout files.
+    '''
+
+    _widget_types[name or widget_type.__name__] = widget_type
+
+def load_layout(filepath: str | os.PathLike[str],
+                *,
+                callbacks: dict[str, t.Callable[..., t.Any]] | None = None,
+                root_size: tuple[int, int] | None = None,
+                cache_path: str | os.PathLike[str] | None = None) -> Layout:
+    '''
+    Builds widget tree from layout file.
+
+    If `root_size` is given, the tree is laid out for this size right away. If `cache_path`
+    is given, compiled layout file (and the layout for `root_size`) is stored there and
+    reused by following calls, as long as the source file does not change.
+    '''
+
+    with open(filepath, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        source = f.read()
+
+    cache = None if cache_path is None else _read_cache(cache_path, filepath, stat, source)
+    is_cache_dirty = False
+
+    if cache is None:
+        root_node = _compile_node(json.loads(source), 'root')
+
+        # widgets without a font use the default one
+        font_names = {_internal.FontCache.DEFAULT_FONT_NAME}
+        _collect_font_names(root_node, font_names)
+
+        cache = _Cache(
+            CACHE_VERSION,
+            os.fspath(filepath),
+            stat.st_mtime_ns,
+            stat.st_size,
+            hashlib.sha256(source).digest(),
+            root_node,
+            tuple(sorted(font_names)),
+            {})
+        is_cache_dirty = True
+
+    widgets = dict[str, Widget]()
+    root = _build_node(cache.root_node, callbacks or {}, widgets)
+
+    if root_size is not None:
+        # result of the layout depends also on global settings, which may change between runs
+        layout_key: _TLayoutKey = (
+            root_size,
+            _internal.get_overflow_behavior(),
+            tuple((name, _internal.FontIndex.resolve(name)) for name in cache.font_names))
+
+        layout_states = cache.layout_states.get(layout_key)
+        if layout_states is not None:
+            for widget, state in zip(_iter_widgets(root), layout_states):
+                if state is not None:
+                    widget.restore_layout_state(state)
+        else:
+            root.rect.size = root_size
+            root.calculate_size(*root_size)
+            root.set_placement(root.rect.x, root.rect.y)
+
+            # layout is only cached if every widget in the tree can restore it
+            states = list[_TLayoutState | None]()
+            for widget in _iter_widgets(root):
+                # widgets skipped by the layout pass (e.g. overflowing children) are laid out on update
+                if widget.needs_layout:
+                    states.append(None)
+                    continue
+
+                state = widget.get_layout_state()
+                if state is None:
+                    break
+
+                states.append(state)
+            else:
+                cache.layout_states[layout_key] = states
+                is_cache_dirty = True
+
+    if cache_path is not None and is_cache_dirty:
+        _write_cache(cache_path, cache)
+
+    return Layout(root, widgets)
+
+class _Cache(t.NamedTuple):
+    version: int
+    source_path: str
+    source_mtime_ns: int
+    source_size: int
+    source_hash: bytes
+    root_node: '_Node'
+    # names of fonts used by the tree
+    font_names: tuple[str, ...]
+    layout_states: dict[_TLayoutKey, list[_TLayoutState | None]]
+
+class _Node(t.NamedTuple):
+    type_name: str
+    name: str | None
+    kwargs: dict[str, t.Any]
+
+# values which can only be created when building the tree
+class _CallbackRef(t.NamedTuple):
+    name: str
+
+class _FontRef(t.NamedTuple):
+    name: str
+    size: int
+
+class _ImageRef(t.NamedTuple):
+    filepath: str
+
+def _read_cache(cache_path: str | os.PathLike[str],
+                filepath: str | os.PathLike[str],
+                stat: os.stat_result,
+                source: bytes) -> _Cache | None:
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(cache, _Cache) or cache.version != CACHE_VERSION or cache.source_path != os.fspath(filepath):
+        return None
+
+    if cache.source_mtime_ns == stat.st_mtime_ns and cache.source_size == stat.st_size:
+        return cache
+
+    # file was touched, but it may still have the same contents
+    if hashlib.sha256(source).digest() != cache.source_hash:
+        return None
+
+    return cache._replace(source_mtime_ns=stat.st_mtime_ns, source_size=stat.st_size)
+
+def _write_cache(cache_path: str | os.PathLike[str], cache: _Cache) -> None:
+    tmp_path = f'{os.fspath(cache_path)}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+
+    os.replace(tmp_path, cache_path)
+
+def _iter_widgets(root: Widget) -> t.Iterator[Widget]:
+    yield root
+
+    if isinstance(root, ContainerWidget):
+        for child in root.children:
+            yield from _iter_widgets(child)
+
+def _collect_font_names(value: t.Any, font_names: set[str]) -> None:
+    if isinstance(value, _FontRef):
+        font_names.add(value.name)
+    elif isinstance(value, _Node):
+        _collect_font_names(value.kwargs, font_names)
+    elif isinstance(value, dict):
+        for x in value.values():
+            _collect_font_names(x, font_names)
+    elif isinstance(value, (list, tuple)):
+        for x in value:
+            _collect_font_names(x, font_names)
+
+def _compile_node(data: t.Any, location: str) -> _Node:
+    if not isinstance(data, dict) or 'type' not in data:
+        raise ValueError(f'Expected widget object with "type" at {location}.')
+
+    type_name = data['type']
+    widget_type = _widget_types.get(type_name)
+    if widget_type is None:
+        raise ValueError(f'Unknown widget type "{type_name}" at {location}.')
+
+    type_hints = t.get_type_hints(widget_type.__init__)
+
+    kwargs = dict[str, t.Any]()
+    for key, value in data.items():
+        if key in ('type', 'name'):
+            continue
+
+        param_name = '_id' if key == 'id' else key
+        if param_name not in type_hints or param_name == 'return':
+            raise ValueError(f'Unknown property "{key}" of {type_name} at {location}.')
+
+        kwargs[param_name] = _compile_value(value, type_hints[param_name], f'{location}.{key}')
+
+    return _Node(type_name, data.get('name'), kwargs)
+
+def _compile_value(value: t.Any, hint: t.Any, location: str) -> t.Any:
+    origin = t.get_origin(hint)
+    args = t.get_args(hint)
+
+    if origin is t.Union or origin is types.UnionType:
+        if value is None and type(None) in args:
+            return None
+
+        for arg in args:
+            if arg is type(None):
+                continue
+
+            try:
+                return _compile_value(value, arg, location)
+            except ValueError:
+                pass
+
+        raise ValueError(f'Invalid value {value!r} at {location}.')
+
+    if origin is list:
+        if not isinstance(value, list):
+            raise ValueError(f'Expected list at {location}.')
+
+        return [_compile_value(x, args[0], f'{location}[{i}]') for i, x in enumerate(value)]
+
+    if origin is tuple:
+        if not isinstance(value, list) or len(value) != len(args):
+            raise ValueError(f'Expected list of {len(args)} values at {location}.')
+
+        return tuple(_compile_value(x, arg, f'{location}[{i}]') for i, (x, arg) in enumerate(zip(value, args)))
+
+    if origin is collections.abc.Callable:
+        if not isinstance(value, str):
+            raise ValueError(f'Expected callback name at {location}.')
+
+        return _CallbackRef(value)
+
+    if isinstance(hint, type):
+        if issubclass(hint, Widget):
+            return _compile_node(value, location)
+
+        if issubclass(hint, enum.Enum):
+            if not isinstance(value, str) or value not in hint.__members__:
+                raise ValueError(f'Expected one of {list(hint.__members__)} at {location}.')
+
+            return hint[value]
+
+        if hint is pg.Color:
+            try:
+                return pg.Color(*value) if isinstance(value, list) else pg.Color(value)
+            except (TypeError, ValueError):
+                raise ValueError(f'Invalid color {value!r} at {location}.') from None
+
+        if hint is pg.Rect:
+            if not isinstance(value, list) or len(value) != 4:
+                raise ValueError(f'Expected [x, y, width, height] at {location}.')
+
+            return pg.Rect(value)
+
+        if hint is PaddingValue:
+            if isinstance(value, int):
+                return PaddingValue(value)
+
+            if isinstance(value, list):
+                return PaddingValue(*value)
+
+            raise ValueError(f'Invalid padding {value!r} at {location}.')
+
+        if hint is pg.font.Font:
+            if not isinstance(value, list) or len(value) != 2:
+                raise ValueError(f'Expected [name, size] at {location}.')
+
+            return _FontRef(value[0], value[1])
+
+        if hint is pg.Surface:
+            if not isinstance(value, str):
+                raise ValueError(f'Expected image file path at {location}.')
+
+            return _ImageRef(value)
+
+        if hint is uuid.UUID:
+            try:
+                return uuid.UUID(value)
+            except (TypeError, ValueError):
+                raise ValueError(f'Invalid id {value!r} at {location}.') from None
+
+        if hint is float and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+
+        if hint in (int, float, str, bool) and not isinstance(value, hint):
+            raise ValueError(f'Expected {hint.__name__} at {location}.')
+
+        if hint in (int, float) and isinstance(value, bool):
+            raise ValueError(f'Expected {hint.__name__} at {location}.')
+
+    return value
+
+def _build_node(node: _Node, callbacks: dict[str, t.Callable[..., t.Any]], widgets: dict[str, Widget]) -> Widget:
+    kwargs = {
+        name: _build_value(value, callbacks, widgets)
+        for name, value in node.kwargs.items()}
+
+    widget = _widget_types[node.type_name](**kwargs)
+    if node.name is not None:
+        widgets[node.name] = widget
+
+    return widget
+
+def _build_value(value: t.Any, callbacks: dict[str, t.Callable[..., t.Any]], widgets: dict[str, Widget]) -> t.Any:
+    if isinstance(value, _Node):
+        return _build_node(value, callbacks, widgets)
+
+    if isinstance(value, _CallbackRef):
+        if value.name not in callbacks:
+            raise ValueError(f'Callback "{value.name}" was not provided.')
+
+        return callbacks[value.name]
+
+    if isinstance(value, _FontRef):
+        return _internal.FontCache.get_font(value.name, value.size)
+
+    if isinstance(value, _ImageRef):
+        return _internal._ImageCache.try_get_image(value.filepath, False)
+
+    # compiled tree can be built many times, so mutable values are not shared between widgets
+    if isinstance(value, (pg.Rect, pg.Color)):
+        return type(value)(value)
+
+    if isinstance(value, list):
+        return [_build_value(x, callbacks, widgets) for x in value]
+
+    if type(value) is tuple:
+        return tuple(_build_value(x, callbacks, widgets) for x in value)
+
+    return value
+
+_widget_types: dict[str, type[Widget]] = {
+    x.__name__: x
+    for x in (
+        Align,
+        Button,
+        Center,
+        Column,
+        Container,
+        DocumentView,
+        Flex,
+        Fraction,
+        Fullscreen,
+        Image,
+        LogView,
+        ProgressBar,
+        Row,
+        ScrollView,
+        Stack,
+        Text,
+        Window)}
+
+# grid requires optional NumPy dependency
+try:
+    from guinea.grid import Grid
+except ImportError:
+    pass
+else:
+    register_widget_type(Grid)
@@ -0,0 +1,144 @@
+import collections
+import uuid
+
+import pygame as pg
+
+from guinea import _internal, surface_pool
+from guinea.widget import Widget
+
+
+class LogView(Widget):
+    '''
+    Widget displaying tail of a stream of text lines. Lines are kept in a bounded
+    ring buffer and only lines appended since the last redraw are rendered; the
+    rest of the image is scrolled up.
+    '''
+
+    layout_state_attributes = ()
+
+    DEFAULT_MAX_LINES = 10000
+    DEFAULT_FONT_SIZE = 16
+    DEFAULT_FG_COLOR = pg.Color(0, 0, 0, 255)
+    DEFAULT_BG_COLOR = pg.Color(255, 255, 255, 255)
+
+    def __init__(self,
+                 lines: list[str] | None = None,
+                 *,
+                 max_lines: int = DEFAULT_MAX_LINES,
+                 fg: pg.Color = DEFAULT_FG_COLOR,
+                 bg: pg.Color = DEFAULT_BG_COLOR,
+                 font: pg.font.Font | None = None,
+                 antialiasing: bool = True,
+                 line_spacing: int = 0,
+                 tab_size: int = 4,
+                 _id: uuid.UUID | None = None,
+                 rect: pg.Rect | None = None) -> None:
+        super().__init__(_id, rect)
+
+        self._fg = fg
+        self._bg = bg
+        self._font = font or _internal.FontCache.get_default_of_size(LogView.DEFAULT_FONT_SIZE)
+        self._antialiasing = antialiasing
+        self._line_spacing = line_spacing
+        self._tab_size = tab_size
+
+        self._lines = collections.deque[str](maxlen=max_lines)
+
+        # rendered surfaces of the last (visible) lines
+        self._line_surfaces = collections.deque[pg.Surface](maxlen=0)
+        self._new_lines_count = 0
+
+        self.image = surface_pool.get_empty()
+
+        if lines is not None:
+            for line in lines:
+                self.append(line)
+
+    def append(self, text: str) -> None:
+        for line in text.replace('\t', ' ' * self._tab_size).split('\n'):
+            self._lines.append(line)
+            self._new_lines_count += 1
+
+        self._needs_redraw = True
+
+    def clear(self) -> None:
+        self._lines.clear()
+        self._line_surfaces.clear()
+        self._new_lines_count = 0
+
+        # force full redraw
+        self.replace_image(surface_pool.get_empty())
+        self._needs_redraw = True
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
+        self.rect.width = max_width
+        self.rect.height = max_height
+
+        return self.rect.size
+
+    def redraw(self) -> None:
+        line_height = self._line_height
+        visible_count = min(-(-self.rect.height // line_height), len(self._lines))
+        new_count = min(self._new_lines_count, visible_count)
+
+        self._new_lines_count = 0
+
+        if self.image.get_size() != self.rect.size or new_count == visible_count or self._line_surfaces.maxlen != visible_count:
+            self._redraw_all(visible_count, new_count)
+            return
+
+        if new_count == 0:
+            return
+
+        # move already rendered lines up and render only the new ones into exposed strip
+        scroll_height = new_count * line_height
+        self.image.scroll(0, -scroll_height)
+        self.image.fill(
+            self._bg,
+            pg.Rect(0, self.rect.height - scroll_height, self.rect.width, scroll_height))
+
+        for i in range(new_count):
+            line_surf = self._render_line(self._lines[i - new_count])
+            self._line_surfaces.append(line_surf)
+
+            self.image.blit(line_surf, (0, self.rect.height - (new_count - i) * line_height))
+
+    def _redraw_all(self, visible_count: int, new_count: int) -> None:
+        # reuse surfaces of old lines which are still visible
+        old_count = visible_count - new_count
+        cached = list(self._line_surfaces)[-old_count:] if old_count > 0 else []
+
+        surfaces = collections.deque[pg.Surface](maxlen=visible_count)
+        for i in range(old_count - len(cached)):
+            surfaces.append(self._render_line(self._lines[i - visible_count]))
+
+        surfaces.extend(cached)
+
+        for i in range(new_count):
+            surfaces.append(self._render_line(self._lines[i - new_count]))
+
+        self._line_surfaces = surfaces
+
+        if self.image.get_size() != self.rect.size:
+            self.replace_image(surface_pool.acquire(self.rect.size))
+
+        self.image.fill(self._bg)
+
+        line_height = self._line_height
+        self.image.blits(
+            (line_surf, (0, self.rect.height - (visible_count - i) * line_height))
+            for i, line_surf in enumerate(surfaces))
+
+    def _render_line(self, line: str) -> pg.Surface:
+        with _internal.font_lock:
+            return self._font.render(line, self._antialiasing, self._fg, self._bg)
+
+    @property
+    def _line_height(self) -> int:
+        return self._font.get_height() + self._line_spacing
+
+    @property
+    def lines_count(self) -> int:
+        return len(self._lines)
@@ -0,0 +1,131 @@
+'''
+Headless rendering of widget trees to image files.
+
+Trees are created by a factory from the given inputs, laid out for a fixed
+size and rendered to an offscreen surface. Batches are distributed across
+a process pool; each worker process uses SDL dummy video driver, so no display
+is required. Outputs only depend on the inputs (and installed fonts), which
+makes them suitable for regression comparison.
+'''
+
+import concurrent.futures
+import multiprocessing
+import os
+import typing as t
+
+import pygame as pg
+
+from guinea import _internal, scheduler, workers
+from guinea.enums import OverflowBehavior
+from guinea.widget import Widget
+
+TInput = t.TypeVar('TInput')
+TFactory = t.Callable[[t.Any], Widget]
+
+DEFAULT_FILENAME_FORMAT = '{index:06d}.png'
+
+def render_to_surface(root: Widget,
+                      size: tuple[int, int],
+                      *,
+                      bg: pg.Color | None = None) -> pg.Surface:
+    '''
+    Lays out widget tree with `root` for given size and renders it into a new surface.
+    If `bg` is `None` the surface is transparent.
+    '''
+
+    group = pg.sprite.LayeredUpdates()
+    Widget.register_widget_stack(group, root)
+
+    root.rect = pg.Rect((0, 0), size)
+    group.update()
+
+    # output cannot wait for time-sliced or threaded redraws
+    scheduler.flush()
+    workers.flush()
+
+    surface = pg.Surface(size, pg.SRCALPHA)
+    surface.fill((0, 0, 0, 0) if bg is None else bg)
+
+    group.draw(surface)
+
+    return surface
+
+def render_batch(factory: t.Callable[[TInput], Widget],
+                 inputs: t.Sequence[TInput],
+                 output_dir: str | os.PathLike[str],
+                 size: tuple[int, int],
+                 *,
+                 bg: pg.Color | None = None,
+                 filename_format: str = DEFAULT_FILENAME_FORMAT,
+                 fonts: t.Iterable[tuple[str, int]] = (),
+                 images: t.Iterable[str] = (),
+                 max_workers: int | None = None,
+                 chunksize: int = 1) -> list[str]:
+    '''
+    Renders a tree created by `factory` for every input and saves it to `output_dir`.
+    Returns paths of the written files, in order of inputs.
+
+    File names are created with `filename_format`, which gets `index` (position in
+    `inputs`) and `input`. `factory` has to be picklable (e.g. a module-level function).
+    Fonts (as `(name, size)` pairs) and image files listed in `fonts` and `images`
+    are loaded by every worker process before it starts rendering.
+    '''
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = [
+        os.path.join(output_dir, filename_format.format(index=i, input=_input))
+        for i, _input in enumerate(inputs)]
+
+    # workers are spawned, so they do not inherit initialized SDL state from this process
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(factory, size, bg, list(fonts), list(images), _internal.get_overflow_behavior())) as executor:
+        for _ in executor.map(_render_to_file, inputs, paths, chunksize=chunksize):
+            pass
+
+    return paths
+
+def _init_worker(factory: TFactory,
+                 size: tuple[int, int],
+                 bg: pg.Color | None,
+                 fonts: list[tuple[str, int]],
+                 images: list[str],
+                 overflow_behavior: OverflowBehavior) -> None:
+    global _factory, _size, _bg
+
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+    pg.display.init()
+    pg.font.init()
+
+    # images are converted to the display format, so some display mode has to be set
+    pg.display.set_mode(size)
+
+    _internal.set_overflow_behavior(overflow_behavior)
+
+    for name, font_size in fonts:
+        _internal.FontCache.get_font(name, font_size)
+
+    for filepath in images:
+        _internal._ImageCache.try_get_image(filepath, False)
+
+    _factory = factory
+    _size = size
+    _bg = bg
+
+def _render_to_file(_input: t.Any, path: str) -> None:
+    assert _factory is not None, 'Worker was not initialized'
+
+    root = _factory(_input)
+
+    surface = render_to_surface(root, _size, bg=_bg)
+    pg.image.save(surface, path)
+
+    root.kill()
+
+_factory: TFactory | None = None
+_size = (0, 0)
+_bg: pg.Color | None = None
@@ -0,0 +1,138 @@
+'''
+Per-frame pointer state.
+
+`MOUSEMOTION` events are not dispatched to widgets one by one. Instead they
+are coalesced (relative movement is summed and only the last position is kept)
+and applied once per frame, when `flush` is called.
+'''
+
+import typing as t
+import weakref
+
+import pygame as pg
+
+from guinea import _internal, events
+
+TMotionListener = t.Callable[[tuple[int, int], tuple[int, int]], None]
+TMotionListenerRef = t.Callable[[], TMotionListener | None]
+
+class HoverTarget(t.Protocol):
+    rect: pg.Rect
+
+    def set_hovered(self, is_hovered: bool) -> None: ...
+
+def flush() -> None:
+    '''
+    Applies motion accumulated since the last flush. Hovered widget is
+    determined once and motion listeners are called with the summed
+    relative movement. Does nothing if the pointer has not moved.
+    '''
+
+    global _has_motion, _rel_x, _rel_y
+
+    if not _has_motion:
+        return
+
+    pos = _pos
+    rel = (_rel_x, _rel_y)
+
+    _has_motion = False
+    _rel_x = _rel_y = 0
+
+    _update_hovered(pos)
+
+    for listener_ref in list(_motion_listeners):
+        listener = listener_ref()
+        if listener is not None:
+            listener(pos, rel)
+
+def register_hover_target(target: HoverTarget) -> None:
+    '''
+    Registers hover target. Targets are held weakly.
+    '''
+
+    _hover_targets.append(weakref.ref(target, _discard_hover_target))
+
+def unregister_hover_target(target: HoverTarget) -> None:
+    global _hovered
+
+    _hover_targets[:] = [x for x in _hover_targets if x() is not target]
+
+    if get_hovered() is target:
+        _hovered = None
+
+def register_motion_listener(listener: TMotionListener) -> None:
+    '''
+    Registers motion listener. Bound methods are held weakly, other callables are held strongly.
+    '''
+
+    _motion_listeners.append(_internal.make_callback_ref(listener, _remove_dead_motion_listeners))
+
+def unregister_motion_listener(listener: TMotionListener) -> None:
+    _motion_listeners[:] = [x for x in _motion_listeners if x() != listener]
+
+def unregister_owner(owner: object) -> None:
+    '''
+    Unregisters owner from hover targets and removes all motion listeners bound to it.
+    '''
+
+    unregister_hover_target(t.cast(HoverTarget, owner))
+
+    _motion_listeners[:] = [
+        x for x in _motion_listeners
+        if getattr(x(), '__self__', None) is not owner]
+
+def get_pos() -> tuple[int, int]:
+    return _pos
+
+def get_hovered() -> HoverTarget | None:
+    return None if _hovered is None else _hovered()
+
+def _update_hovered(pos: tuple[int, int]) -> None:
+    global _hovered
+
+    # most recently registered targets are checked first
+    hovered: HoverTarget | None = None
+    for target_ref in reversed(_hover_targets):
+        target = target_ref()
+        if target is not None and target.rect.collidepoint(pos):
+            hovered = target
+            break
+
+    previous = get_hovered()
+    if hovered is previous:
+        return
+
+    _hovered = None if hovered is None else weakref.ref(hovered)
+
+    if previous is not None:
+        previous.set_hovered(False)
+
+    if hovered is not None:
+        hovered.set_hovered(True)
+
+def _discard_hover_target(target_ref: weakref.ref[HoverTarget]) -> None:
+    if target_ref in _hover_targets:
+        _hover_targets.remove(target_ref)
+
+def _remove_dead_motion_listeners() -> None:
+    _motion_listeners[:] = [x for x in _motion_listeners if x() is not None]
+
+def _motion_handler(event: pg.event.Event) -> None:
+    global _has_motion, _pos, _rel_x, _rel_y
+
+    _pos = event.pos
+    _rel_x += event.rel[0]
+    _rel_y += event.rel[1]
+    _has_motion = True
+
+_pos: tuple[int, int] = (0, 0)
+_rel_x = 0
+_rel_y = 0
+_has_motion = False
+
+_hovered: weakref.ref[HoverTarget] | None = None
+_hover_targets = list[weakref.ref[HoverTarget]]()
+_motion_listeners = list[TMotionListenerRef]()
+
+events.register_handler(pg.MOUSEMOTION, _motion_handler)
@@ -2,7 +2,7 @@ import uuid
 
 import pygame as pg
 
-from guinea import _internal
+from guinea import _internal, surface_pool
 # from pygame_widgets._internal import (TargetFill, apply_target_fill_to_surface,
 #                                       get_surface_flags_for_target_fill)
 from guinea.widget import Widget
@@ -11,6 +11,9 @@ DEFAULT_BG = pg.Color(0, 0, 0, 255)
 DEFAULT_FG = pg.Color(0, 255, 0, 255)
 
 class ProgressBar(Widget):
+    supports_threaded_redraw = True
+    layout_state_attributes = ()
+
     def __init__(self,
                  start_value: float,
                  max_value: float | None,
@@ -24,7 +27,7 @@ class ProgressBar(Widget):
 
         assert max_value is not None, "Indefinite progress bar is not implemented yet"
 
-        self.image = pg.Surface((0, 0))
+        self.image = surface_pool.get_empty()
 
         self._max_value = max_value
         self._value = start_value
@@ -33,23 +36,43 @@ class ProgressBar(Widget):
         self._rounding = rounding
 
     def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
         self.rect.width = max_width
         self.rect.height = max_height
 
         return (max_width, max_height)
 
     def set_placement(self, x: int, y: int) -> None:
-        self.rect.x = x
-        self.rect.y = y
+        super().set_placement(x, y)
+
+    def can_draw_into(self) -> bool:
+        return all((
+            self._rounding == 0,
+            isinstance(self._bg, pg.Color) and self._bg.a == 255,
+            isinstance(self._fg, pg.Color)))
+
+    def draw_into(self, target: pg.Surface) -> None:
+        assert isinstance(self._bg, pg.Color) and isinstance(self._fg, pg.Color)
+
+        target.fill(self._bg)
+        target.fill(
+            self._fg,
+            pg.Rect(
+                0,
+                0,
+                _internal.round(self.rect.width * (self._value / self._max_value)),
+                self.rect.height))
 
     def redraw(self) -> None:
+        self.replace_image(self.render_image())
+
+    def render_image(self) -> pg.Surface:
         surf_flags = 0
         if self._rounding != 0:
             surf_flags |= pg.SRCALPHA
 
-        img = pg.Surface(
-            self.rect.size,
-            surf_flags)
+        img = surface_pool.acquire(self.rect.size, surf_flags)
 
         if isinstance(self._bg, pg.Color):
             if self._rounding != 0:
@@ -93,7 +116,7 @@ class ProgressBar(Widget):
           # 	get_surface_flags_for_target_fill(self._fg))
         # apply_target_fill_to_surface(bar_img, )
 
-        self.image = img
+        return img
 
     def increment(self, value: float) -> None:
         self._value = max(self._value + value, self._max_value)
@@ -0,0 +1,172 @@
+'''
+Opt-in time-sliced redraws.
+
+When enabled, widgets are not redrawn during their update. Instead they are queued
+and redrawn by `run_scheduled_redraws` (which has to be called once per frame, after
+the group is updated and before it is drawn) until the frame budget is spent.
+Visible widgets are redrawn first, then widgets with higher `redraw_priority`,
+then in order of scheduling. Redraws which did not fit roll over to the next frame,
+until then the old image stays on screen.
+'''
+
+from __future__ import annotations
+
+import time
+import typing as t
+import weakref
+
+import pygame as pg
+
+if t.TYPE_CHECKING:
+    from guinea.widget import Widget
+
+DEFAULT_BUDGET = 0.004
+
+# weight of the last redraw in the estimated redraw cost of a widget type
+_COST_SMOOTHING = 0.2
+
+class RedrawStats(t.NamedTuple):
+    redrawn: int
+    deferred: int
+    elapsed: float
+    # estimated time needed to redraw the deferred widgets
+    deferred_cost: float
+
+def enable_redraw_budget(budget: float = DEFAULT_BUDGET) -> None:
+    '''
+    Enables scheduled redraws with the given time budget (in seconds) per frame.
+    '''
+
+    global _budget
+
+    assert budget > 0, 'Redraw budget has to be positive'
+
+    _budget = budget
+
+def disable_redraw_budget() -> None:
+    '''
+    Disables scheduled redraws, redrawing all widgets which are still queued.
+    '''
+
+    global _budget
+
+    if _budget is None:
+        return
+
+    _budget = None
+
+    flush()
+
+def is_redraw_budget_enabled() -> bool:
+    return _budget is not None
+
+def schedule(widget: Widget) -> bool:
+    '''
+    Queues widget redraw. Returns `False` if scheduled redraws are disabled,
+    in which case the widget has to be redrawn immediately.
+    '''
+
+    global _schedule_counter
+
+    if _budget is None or not widget.supports_scheduled_redraw:
+        return False
+
+    # widget which is already queued keeps its place
+    if widget not in _pending:
+        _schedule_counter += 1
+        _pending[widget] = _schedule_counter
+
+    return True
+
+def run_scheduled_redraws(budget: float | None = None) -> RedrawStats:
+    '''
+    Redraws queued widgets until `budget` (or the budget given when enabling) is spent.
+    At least one widget is redrawn, so the queue always progresses.
+    '''
+
+    global _last_stats
+
+    if budget is None:
+        budget = _budget or DEFAULT_BUDGET
+
+    start = time.perf_counter()
+
+    redrawn = 0
+    for widget in _get_ordered_pending():
+        elapsed = time.perf_counter() - start
+        if redrawn > 0 and elapsed >= budget:
+            break
+
+        del _pending[widget]
+        _redraw(widget)
+        redrawn += 1
+
+    _last_stats = RedrawStats(
+        redrawn,
+        len(_pending),
+        time.perf_counter() - start,
+        _estimate_pending_cost())
+
+    return _last_stats
+
+def flush() -> None:
+    '''
+    Redraws all queued widgets, regardless of the budget.
+    '''
+
+    for widget in _get_ordered_pending():
+        del _pending[widget]
+        _redraw(widget)
+
+def get_redraw_stats() -> RedrawStats:
+    '''
+    Returns statistics of the last `run_scheduled_redraws` call.
+    '''
+
+    return _last_stats
+
+def get_pending_count() -> int:
+    return len(_pending)
+
+def _get_ordered_pending() -> list[Widget]:
+    display = pg.display.get_surface()
+    screen_rect = display.get_rect() if display is not None else None
+
+    def key(widget: Widget) -> tuple[bool, int, int]:
+        # children of windows and scroll views are not placed in screen coordinates
+        is_visible = bool(widget.visible) and (screen_rect is None or screen_rect.colliderect(widget.get_screen_rect()))
+        return (not is_visible, -widget.redraw_priority, _pending[widget])
+
+    return sorted(_pending.keys(), key=key)
+
+def _redraw(widget: Widget) -> None:
+    start = time.perf_counter()
+
+    widget.redraw()
+    widget.dirty = 1
+
+    cost = time.perf_counter() - start
+
+    widget_type = type(widget)
+    previous_cost = _costs.get(widget_type)
+    _costs[widget_type] = cost if previous_cost is None else previous_cost + (cost - previous_cost) * _COST_SMOOTHING
+
+def _estimate_pending_cost() -> float:
+    if len(_costs) == 0:
+        return 0.0
+
+    # types which were not redrawn yet are assumed to cost as much as an average type
+    default_cost = sum(_costs.values()) / len(_costs)
+
+    return sum(_costs.get(type(widget), default_cost) for widget in _pending.keys())
+
+_budget: float | None = None
+_schedule_counter = 0
+
+# widget -> scheduling order
+_pending = weakref.WeakKeyDictionary['Widget', int]()
+
+# estimated redraw cost of a widget type
+_costs = dict[type, float]()
+
+_last_stats = RedrawStats(0, 0, 0.0, 0.0)
@@ -0,0 +1,239 @@
+import typing as t
+import uuid
+
+import pygame as pg
+
+from guinea import events, pointer, surface_pool
+from guinea.widget import Widget
+
+# available size of the content along scrolled axes
+MAX_CONTENT_SIZE = 2 ** 15
+
+class ScrollView(Widget):
+    '''
+    Widget displaying part of its (possibly larger) child. Child is laid out with
+    unbounded size along scrolled axes and drawn into a viewport surface. When scrolled,
+    already drawn pixels are moved and only the newly exposed strip is redrawn.
+    Children which change are redrawn only in their area.
+
+    Note that child widgets which fill all available space (e.g. `ProgressBar`) need
+    a fixed size along scrolled axes.
+    '''
+
+    # redraw only requests painting, which happens during update
+    supports_scheduled_redraw = False
+
+    DEFAULT_BG = pg.Color(255, 255, 255, 255)
+    DEFAULT_SCROLL_STEP = 20
+
+    def __init__(self,
+                 child: Widget,
+                 *,
+                 bg: pg.Color = DEFAULT_BG,
+                 vertical: bool = True,
+                 horizontal: bool = False,
+                 scroll_step: int = DEFAULT_SCROLL_STEP,
+                 drag_to_scroll: bool = True,
+                 _id: uuid.UUID | None = None,
+                 rect: pg.Rect | None = None) -> None:
+        super().__init__(_id, rect)
+
+        self.child = child
+        child.set_parent(self) # type: ignore
+
+        self._bg = bg
+        self._vertical = vertical
+        self._horizontal = horizontal
+        self._scroll_step = scroll_step
+        self._drag_to_scroll = drag_to_scroll
+
+        self.image = surface_pool.get_empty()
+
+        # child is drawn only into the viewport, so it is kept in its own group
+        self._inner_group = pg.sprite.LayeredUpdates()
+        Widget.register_widget_stack(self._inner_group, child)
+
+        self._content_size = (0, 0)
+        self._scroll_x = 0
+        self._scroll_y = 0
+
+        # scroll position at the time of the last paint
+        self._painted_scroll = (0, 0)
+        self._needs_full_paint = True
+
+        self._is_dragging = False
+
+        # inner sprites and their rects, collected once per update
+        self._sprites = list[pg.sprite.Sprite]()
+        self._sprite_rects = list[pg.Rect]()
+
+        # rects of inner sprites at the previous update, so that the area left by a moved
+        # or shrunk sprite is repainted too
+        self._previous_sprite_rects = dict[pg.sprite.Sprite, pg.Rect]()
+
+        events.register_handler(pg.MOUSEWHEEL, self._mouse_wheel_handler)
+        events.register_handler(pg.MOUSEBUTTONDOWN, self._mouse_button_down_handler)
+        events.register_handler(pg.MOUSEBUTTONUP, self._mouse_button_up_handler)
+        pointer.register_motion_listener(self._pointer_motion_callback)
+
+    def scroll_to(self, x: int, y: int) -> None:
+        max_x = max(self._content_size[0] - self.rect.width, 0)
+        max_y = max(self._content_size[1] - self.rect.height, 0)
+
+        self._scroll_x = max(0, min(x, max_x)) if self._horizontal else 0
+        self._scroll_y = max(0, min(y, max_y)) if self._vertical else 0
+
+    def scroll(self, dx: int, dy: int) -> None:
+        self.scroll_to(self._scroll_x + dx, self._scroll_y + dy)
+
+    def map_child_rect(self, rect: pg.Rect) -> pg.Rect:
+        # children are placed in content coordinates and clipped to the viewport
+        return rect.move(self.rect.x - self._scroll_x, self.rect.y - self._scroll_y).clip(self.rect)
+
+    def kill(self) -> None:
+        self.child.kill()
+
+        super().kill()
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
+        self.rect.width = max_width
+        self.rect.height = max_height
+
+        # child is laid out in content coordinates, the viewport is moved over it
+        self._content_size = self.child.calculate_size(
+            MAX_CONTENT_SIZE if self._horizontal else max_width,
+            MAX_CONTENT_SIZE if self._vertical else max_height)
+        self.child.set_placement(0, 0)
+
+        self.scroll_to(self._scroll_x, self._scroll_y)
+
+        return self.rect.size
+
+    # viewport is painted once per update, after the child was updated
+    def redraw(self) -> None:
+        self._needs_full_paint = True
+
+    def update(self, *args: t.Any, **kwargs: t.Any) -> None:
+        pointer.flush()
+
+        super().update(*args, **kwargs)
+        self._inner_group.update(*args, **kwargs)
+
+        self._sprites = self._inner_group.sprites()
+        self._sprite_rects = [sprite.rect for sprite in self._sprites]
+
+        previous_sprite_rects = self._previous_sprite_rects
+        self._previous_sprite_rects = {}
+
+        dirty_rects = list[pg.Rect]()
+        for sprite in self._sprites:
+            rect = sprite.rect
+
+            previous_rect = previous_sprite_rects.get(sprite)
+            if previous_rect is None or previous_rect != rect:
+                self._previous_sprite_rects[sprite] = rect.copy()
+            else:
+                self._previous_sprite_rects[sprite] = previous_rect
+
+            if sprite.dirty:
+                sprite.dirty = 0
+
+                if previous_rect is not None:
+                    rect = rect.union(previous_rect)
+
+                dirty_rects.append(rect.move(-self._scroll_x, -self._scroll_y))
+
+        scroll = (self._scroll_x, self._scroll_y)
+
+        if self._needs_full_paint or self.image.get_size() != self.rect.size:
+            self._needs_full_paint = False
+
+            if self.image.get_size() != self.rect.size:
+                self.replace_image(surface_pool.acquire(self.rect.size))
+
+            self._paint(self.image.get_rect())
+        else:
+            if scroll != self._painted_scroll:
+                self._scroll_viewport(scroll[0] - self._painted_scroll[0], scroll[1] - self._painted_scroll[1])
+
+            viewport_rect = self.image.get_rect()
+            for rect in dirty_rects:
+                rect = rect.clip(viewport_rect)
+                if rect.width > 0 and rect.height > 0:
+                    self._paint(rect)
+
+            if scroll == self._painted_scroll and len(dirty_rects) == 0:
+                return
+
+        self._painted_scroll = scroll
+        self.dirty = 1
+
+    def _scroll_viewport(self, dx: int, dy: int) -> None:
+        width, height = self.image.get_size()
+        if abs(dx) >= width or abs(dy) >= height:
+            self._paint(self.image.get_rect())
+            return
+
+        # move already drawn pixels and paint only the exposed strips
+        self.image.scroll(-dx, -dy)
+
+        if dy > 0:
+            self._paint(pg.Rect(0, height - dy, width, dy))
+        elif dy < 0:
+            self._paint(pg.Rect(0, 0, width, -dy))
+
+        if dx > 0:
+            self._paint(pg.Rect(width - dx, 0, dx, height))
+        elif dx < 0:
+            self._paint(pg.Rect(0, 0, -dx, height))
+
+    def _paint(self, rect: pg.Rect) -> None:
+        '''
+        Repaints given part of the viewport.
+        '''
+
+        content_rect = rect.move(self._scroll_x, self._scroll_y)
+
+        self.image.set_clip(rect)
+        self.image.fill(self._bg, rect)
+
+        for i in content_rect.collidelistall(self._sprite_rects):
+            sprite = self._sprites[i]
+            if sprite.visible:
+                self.image.blit(sprite.image, (sprite.rect.x - self._scroll_x, sprite.rect.y - self._scroll_y))
+
+        self.image.set_clip(None)
+
+    def _mouse_wheel_handler(self, event: pg.event.Event) -> None:
+        if self.rect.collidepoint(pointer.get_pos()):
+            self.scroll(event.x * self._scroll_step, -event.y * self._scroll_step)
+
+    def _mouse_button_down_handler(self, event: pg.event.Event) -> None:
+        pointer.flush()
+
+        if self._drag_to_scroll and event.button == pg.BUTTON_LEFT and self.rect.collidepoint(event.pos):
+            self._is_dragging = True
+
+    def _mouse_button_up_handler(self, event: pg.event.Event) -> None:
+        pointer.flush()
+
+        if event.button == pg.BUTTON_LEFT:
+            self._is_dragging = False
+
+    def _pointer_motion_callback(self, pos: tuple[int, int], rel: tuple[int, int]) -> None:
+        if self._is_dragging:
+            self.scroll(-rel[0], -rel[1])
+
+    @property
+    def content_size(self) -> tuple[int, int]:
+        return self._content_size
+
+    @property
+    def scroll_x(self) -> int:
+        return self._scroll_x
+
+    @property
+    def scroll_y(self) -> int:
+        return self._scroll_y
@@ -6,6 +6,8 @@ from guinea.widget import ContainerWidget, Widget
 
 
 class Stack(ContainerWidget):
+    layout_state_attributes = ()
+
     def __init__(self,
                  children: list[Widget],
                  _id: uuid.UUID | None = None,
@@ -0,0 +1,144 @@
+'''
+Pool of surfaces reused between widget redraws.
+
+Widgets which rebuild their whole image on redraw borrow a surface of the
+required size from the pool and return the previous one. Sizes are rounded up
+to size classes, so a widget which is being resized by a few pixels keeps
+reusing the same backing surface (it gets a subsurface of the exact size).
+Total size of surfaces kept in the pool is bounded; least recently returned
+size classes are dropped first.
+
+A surface may only be released by its sole user, after which it must not be
+used anymore. Surfaces which were not acquired from the pool are ignored by `release`.
+'''
+
+import collections
+import threading
+import weakref
+
+import pygame as pg
+
+DEFAULT_MAX_RETAINED_BYTES = 32 * 1024 * 1024
+
+# all dimensions up to this value are rounded to multiple of this value
+_MIN_SIZE_STEP = 16
+
+_TKey = tuple[int, int, int]
+
+def acquire(size: tuple[int, int], flags: int = 0) -> pg.Surface:
+    '''
+    Returns surface of given size and flags, cleared like a newly created surface.
+    '''
+
+    global _retained_bytes
+
+    width, height = size
+    if width == 0 or height == 0:
+        if width == 0 and height == 0:
+            return get_empty()
+
+        return pg.Surface(size, flags)
+
+    key = (_get_size_class(width), _get_size_class(height), flags)
+
+    with _lock:
+        backing: pg.Surface | None = None
+
+        free = _free.get(key)
+        if free:
+            backing = free.pop()
+            _retained_bytes -= _get_surface_bytes(backing)
+
+            if len(free) == 0:
+                del _free[key]
+
+        if backing is None:
+            backing = pg.Surface(key[:2], flags)
+
+        surface = backing if backing.get_size() == size else backing.subsurface((0, 0), size)
+        _borrowed[surface] = (key, backing)
+
+    surface.fill((0, 0, 0, 0))
+
+    return surface
+
+def release(surface: pg.Surface) -> None:
+    '''
+    Returns surface acquired from the pool.
+    '''
+
+    global _retained_bytes
+
+    with _lock:
+        entry = _borrowed.pop(surface, None)
+        if entry is None:
+            return
+
+        key, backing = entry
+
+        surface_bytes = _get_surface_bytes(backing)
+        if surface_bytes > _max_retained_bytes:
+            return
+
+        _free.setdefault(key, []).append(backing)
+        _free.move_to_end(key)
+        _retained_bytes += surface_bytes
+
+        _evict(_max_retained_bytes)
+
+def get_empty() -> pg.Surface:
+    '''
+    Returns shared surface of size (0, 0), usable as a placeholder image.
+    '''
+
+    global _empty
+
+    if _empty is None:
+        _empty = pg.Surface((0, 0))
+
+    return _empty
+
+def set_max_retained_bytes(max_bytes: int) -> None:
+    global _max_retained_bytes
+
+    with _lock:
+        _max_retained_bytes = max_bytes
+        _evict(max_bytes)
+
+def get_retained_bytes() -> int:
+    return _retained_bytes
+
+def clear() -> None:
+    with _lock:
+        _evict(0)
+
+def _evict(max_bytes: int) -> None:
+    global _retained_bytes
+
+    while _retained_bytes > max_bytes:
+        key, free = next(iter(_free.items()))
+
+        backing = free.pop(0)
+        _retained_bytes -= _get_surface_bytes(backing)
+
+        if len(free) == 0:
+            del _free[key]
+
+def _get_size_class(x: int) -> int:
+    # classes get coarser with size, so the wasted area stays below ~12.5% per dimension
+    step = max(_MIN_SIZE_STEP, 1 << max(x.bit_length() - 4, 0))
+    return -(-x // step) * step
+
+def _get_surface_bytes(surface: pg.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+_lock = threading.Lock()
+_max_retained_bytes = DEFAULT_MAX_RETAINED_BYTES
+_retained_bytes = 0
+
+# free backing surfaces by (class width, class height, flags), in order of last release
+_free = collections.OrderedDict[_TKey, list[pg.Surface]]()
+# surfaces handed out by the pool, mapped to their backing surface
+_borrowed = weakref.WeakKeyDictionary[pg.Surface, tuple[_TKey, pg.Surface]]()
+
+_empty: pg.Surface | None = None
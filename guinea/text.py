@@ -1,8 +1,10 @@
+import collections
+import typing as t
 import uuid
 
 import pygame as pg
 
-from guinea import _internal
+from guinea import _internal, surface_pool
 from guinea._internal import TargetFill
 from guinea.enums import TextAlign, TextFit
 from guinea.shaders import Shader
@@ -11,9 +13,20 @@ from guinea.widget import Widget
 _BlitTarget = tuple[pg.Surface, tuple[int, int]]
 
 class Text(Widget):
+    supports_threaded_redraw = True
+    layout_state_attributes = (
+        '_layout_lines',
+        '_layout_line_widths',
+        '_wrap_width',
+        '_required_width',
+        '_required_height')
+
     DEFAULT_FONT_SIZE = 24
     DEFAULT_FG_COLOR = pg.Color(0, 0, 0, 255)
 
+    # number of font sizes for which the size of the text is remembered while fitting
+    LINE_METRICS_CACHE_SIZE = 16
+
     def __init__(self,
                  text: str,
                  *,
@@ -42,29 +55,57 @@ class Text(Widget):
         self._required_width = 0
         self._required_height = 0
 
-        self.image = pg.Surface((0, 0))
+        # lines which are actually rendered (differ from `_lines` when wrapping)
+        self._layout_lines = self._lines
+
+        # word widths are measured once, so wrapping to a new width does not require measuring text again
+        self._paragraph_words = [line.split(' ') for line in self._lines] if fit == TextFit.WRAP else []
+        self._paragraph_word_widths: list[list[int]] | None = None
+        self._layout_line_widths = list[int]()
+        self._wrap_width = -1
+
+        # font used for rendering (differs from `_font` when fitting font size)
+        self._render_font = self._font
+
+        # keyed by `FontCache` key (so cached fonts are not kept alive), least recently used first
+        self._line_metrics = collections.OrderedDict[tuple[str, int] | pg.font.Font, tuple[int, int]]()
+
+        # rendered lines reused by `draw_into` until the layout changes
+        self._blit_targets: list[_BlitTarget] | None = None
+        self._blit_targets_key: tuple[pg.font.Font, int] | None = None
+        # lines the targets were generated from, kept alive so a new layout is never mistaken for it
+        self._blit_targets_lines: list[str] | None = None
+
+        self.image = surface_pool.get_empty()
 
     def _render_line(self, line: str) -> pg.Surface:
-        if isinstance(self._fg , pg.Color):
-            return self._font.render(
+        with _internal.font_lock:
+            if isinstance(self._fg , pg.Color):
+                return self._render_font.render(
+                    line,
+                    self._antialiasing,
+                    self._fg)
+
+            return self._render_font.render(
                 line,
                 self._antialiasing,
-                self._fg)
-
-        return self._font.render(
-            line,
-            self._antialiasing,
-            (255, 255, 255, 255))
+                (255, 255, 255, 255))
 
     def _fit_image(self, img: pg.Surface) -> pg.Surface:
         target_size = (
             min(self._required_width, self.rect.width),
             min(self._required_height, self.rect.height))
 
-        if self._fit == TextFit.FIT:
-            return pg.transform.smoothscale(img, target_size)
+        if self._fit == TextFit.FIT or self._fit == TextFit.FIT_FONT:
+            fitted_img = pg.transform.smoothscale(
+                img,
+                target_size,
+                surface_pool.acquire(target_size, img.get_flags() & pg.SRCALPHA))
+            surface_pool.release(img)
+
+            return fitted_img
 
-        return self.image.subsurface((0, 0), target_size)
+        return img.subsurface((0, 0), target_size)
 
     def _get_x_alignment(self, avail_width: int, width: int) -> int:
         if self._align == TextAlign.RIGHT:
@@ -79,7 +120,7 @@ class Text(Widget):
         current_y = 0
         targets: list[_BlitTarget] = []
 
-        for line in self._lines:
+        for line in self._layout_lines:
             line_surf = self._render_line(line)
             pos = (
                 self._get_x_alignment(self._required_width, line_surf.get_width()),
@@ -90,14 +131,50 @@ class Text(Widget):
 
         return targets
 
+    def get_layout_state(self) -> tuple[tuple[int, int, int, int], tuple[t.Any, ...]] | None:
+        # font fitted by `TextFit.FIT_FONT` is not a part of the state
+        if self._render_font is not self._font:
+            return None
+
+        return super().get_layout_state()
+
+    def can_draw_into(self) -> bool:
+        is_scaled = (
+            (self._fit == TextFit.FIT or self._fit == TextFit.FIT_FONT)
+            and (self._required_width > self.rect.width or self._required_height > self.rect.height))
+
+        return all((
+            not is_scaled,
+            isinstance(self._bg, pg.Color) and self._bg.a == 255,
+            isinstance(self._fg, pg.Color)))
+
+    def draw_into(self, target: pg.Surface) -> None:
+        assert isinstance(self._bg, pg.Color)
+
+        # wrapping replaces `_layout_lines` with a new list, so identity of the list is enough
+        key = (self._render_font, self._required_width)
+        if (self._blit_targets is None
+            or key != self._blit_targets_key
+            or self._layout_lines is not self._blit_targets_lines):
+            self._blit_targets = self._generate_blit_targets()
+            self._blit_targets_key = key
+            self._blit_targets_lines = self._layout_lines
+
+        # target has the size of the widget, so text which does not fit is cropped
+        target.fill(self._bg)
+        target.blits(self._blit_targets)
+
     def redraw(self) -> None:
+        self.replace_image(self.render_image())
+
+    def render_image(self) -> pg.Surface:
         # render text background
         surface_flags = 0
         if self._bg is None:
             surface_flags = pg.SRCALPHA
         else:
             surface_flags = _internal.get_surface_flags_for_target_fill(self._bg)
-        src_img = pg.Surface(
+        src_img = surface_pool.acquire(
             (self._required_width, self._required_height),
             surface_flags)
 
@@ -116,7 +193,7 @@ class Text(Widget):
         if isinstance(self._fg, pg.Color):
             src_img.blits(targets)
         else:
-            text_img = pg.Surface(src_img.get_size(), pg.SRCALPHA)
+            text_img = surface_pool.acquire(src_img.get_size(), pg.SRCALPHA)
             text_img.blits(targets)
 
             if isinstance(self._fg, pg.Surface):
@@ -128,24 +205,99 @@ class Text(Widget):
                 self._fg.draw(text_img, True)
 
             src_img.blit(text_img, (0, 0))
+            surface_pool.release(text_img)
 
         # crop image according to used text
         if self._required_width > self.rect.width or self._required_height > self.rect.height:
             src_img = self._fit_image(src_img)
 
-        self.image = src_img
+        return src_img
 
-    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
-        super().calculate_size(max_width, max_height)
+    def _wrap(self, max_width: int) -> None:
+        if max_width == self._wrap_width:
+            return
+
+        if self._paragraph_word_widths is None:
+            self._paragraph_word_widths = [
+                _internal.TextMetricsCache.get_word_widths(self._font, words)
+                for words in self._paragraph_words]
+
+        space_width, = _internal.TextMetricsCache.get_word_widths(self._font, ' ')
+
+        self._layout_lines, self._layout_line_widths = _wrap_words(
+            self._paragraph_words,
+            self._paragraph_word_widths,
+            space_width,
+            max_width)
+        self._wrap_width = max_width
+
+    def _measure_lines(self, font: pg.font.Font) -> tuple[int, int]:
+        key = _internal.FontCache.get_font_key(font) or font
+
+        metrics = self._line_metrics.get(key)
+        if metrics is not None:
+            self._line_metrics.move_to_end(key)
+            return metrics
 
         required_height = 0
         required_width = 0
         for line in self._lines:
-            line_width, line_height = self._font.size(line)
+            with _internal.font_lock:
+                line_width, line_height = font.size(line)
 
             required_width = max(required_width, line_width)
             required_height += line_height + self._line_spacing
 
+        self._line_metrics[key] = (required_width, required_height)
+        if len(self._line_metrics) > Text.LINE_METRICS_CACHE_SIZE:
+            self._line_metrics.popitem(last=False)
+
+        return (required_width, required_height)
+
+    def _find_fitting_font(self, max_width: int, max_height: int, required_width: int, required_height: int) -> pg.font.Font | None:
+        font_key = _internal.FontCache.get_font_key(self._font)
+        if font_key is None:
+            return None
+
+        name, base_size = font_key
+
+        def fits(size: int) -> bool:
+            width, height = self._measure_lines(_internal.FontCache.get_font(name, size))
+            return width <= max_width and height <= max_height
+
+        # text size is roughly proportional to font size, so only few corrections of the estimate are needed
+        ratio = min(max_width / required_width, max_height / required_height)
+        size = max(1, min(base_size - 1, int(base_size * ratio)))
+
+        while size > 1 and not fits(size):
+            size -= 1
+
+        while size + 1 < base_size and fits(size + 1):
+            size += 1
+
+        return _internal.FontCache.get_font(name, size)
+
+    def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
+        self._render_font = self._font
+
+        required_height = 0
+        required_width = 0
+        if self._fit == TextFit.WRAP:
+            self._wrap(max_width)
+
+            required_width = max(self._layout_line_widths, default=0)
+            required_height = len(self._layout_lines) * (self._font.get_height() + self._line_spacing)
+        else:
+            required_width, required_height = self._measure_lines(self._font)
+
+            if self._fit == TextFit.FIT_FONT and (required_width > max_width or required_height > max_height):
+                font = self._find_fitting_font(max_width, max_height, required_width, required_height)
+                if font is not None:
+                    self._render_font = font
+                    required_width, required_height = self._measure_lines(font)
+
         self.rect.width = min(max_width, required_width)
         self.rect.height = min(max_height, required_height)
 
@@ -156,3 +308,34 @@ class Text(Widget):
 
 def _split_text_lines(text: str, tab_size: int) -> list[str]:
     return [x for x in text.replace('\t', ' ' * tab_size).split('\n') if x != '']
+
+def _wrap_words(paragraphs: list[list[str]],
+                word_widths: list[list[int]],
+                space_width: int,
+                max_width: int) -> tuple[list[str], list[int]]:
+    lines = list[str]()
+    line_widths = list[int]()
+
+    for words, widths in zip(paragraphs, word_widths):
+        line_start = 0
+        line_width = 0
+
+        for i, width in enumerate(widths):
+            if i == line_start:
+                line_width = width
+                continue
+
+            new_width = line_width + space_width + width
+            if new_width > max_width:
+                lines.append(' '.join(words[line_start:i]))
+                line_widths.append(line_width)
+
+                line_start = i
+                line_width = width
+            else:
+                line_width = new_width
+
+        lines.append(' '.join(words[line_start:]))
+        line_widths.append(line_width)
+
+    return (lines, line_widths)
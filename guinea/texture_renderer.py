@@ -0,0 +1,109 @@
+'''
+Compositing backend using SDL2 renderer (`pygame._sdl2.video`).
+
+Instead of blitting images of all sprites into the screen surface every frame,
+the image of every sprite is uploaded into a texture and frames are composed
+by the renderer. A texture is uploaded again only when its sprite is dirty
+(`dirty` is reset after upload the same way as `LayeredDirty` does) or when
+the sprite got a different image. Invisible sprites and empty images are skipped.
+
+The renderer works also without a GPU (software renderer, e.g. on headless machines).
+'''
+
+import typing as t
+import weakref
+
+import pygame as pg
+from pygame._sdl2 import video
+
+
+class TextureRenderer:
+    def __init__(self, renderer: video.Renderer, *, bg: pg.Color | None = None) -> None:
+        self.renderer = renderer
+        self.bg = bg
+
+        # sprite -> (texture, image it was uploaded from)
+        self._textures = weakref.WeakKeyDictionary[pg.sprite.Sprite, tuple[video.Texture, pg.Surface]]()
+
+        self.uploads_count = 0
+
+    @classmethod
+    def create(cls,
+               title: str,
+               size: tuple[int, int],
+               *,
+               accelerated: bool = False,
+               vsync: bool = False,
+               bg: pg.Color | None = None) -> 'TextureRenderer':
+        '''
+        Creates window with its own renderer. Software renderer is used unless `accelerated` is set.
+        '''
+
+        window = video.Window(title, size=size)
+        renderer = video.Renderer(window, accelerated=int(accelerated), vsync=vsync)
+
+        return cls(renderer, bg=bg)
+
+    def draw(self, sprites: pg.sprite.AbstractGroup | t.Iterable[pg.sprite.Sprite]) -> None:
+        '''
+        Composes the sprites (in order of the group) into the renderer target.
+        The target is cleared first if `bg` is set. Call `present` to show the frame.
+        '''
+
+        renderer = self.renderer
+        if self.bg is not None:
+            renderer.draw_color = self.bg
+            renderer.clear()
+
+        if isinstance(sprites, pg.sprite.AbstractGroup):
+            sprites = sprites.sprites()
+
+        for sprite in sprites:
+            if not getattr(sprite, 'visible', True):
+                continue
+
+            image = sprite.image
+            width, height = image.get_size()
+            if width == 0 or height == 0:
+                continue
+
+            texture = self._get_texture(sprite, image)
+            texture.draw(dstrect=(sprite.rect.x, sprite.rect.y, width, height))
+
+    def present(self) -> None:
+        self.renderer.present()
+
+    def forget(self, sprite: pg.sprite.Sprite) -> None:
+        '''
+        Drops texture of the sprite (textures of removed sprites are dropped automatically).
+        '''
+
+        self._textures.pop(sprite, None)
+
+    def clear(self) -> None:
+        self._textures.clear()
+
+    @property
+    def textures_count(self) -> int:
+        return len(self._textures)
+
+    def _get_texture(self, sprite: pg.sprite.Sprite, image: pg.Surface) -> video.Texture:
+        # sprites without dirty flag are treated as always dirty
+        dirty = getattr(sprite, 'dirty', 2)
+
+        entry = self._textures.get(sprite)
+        if entry is not None and entry[1] is image:
+            texture = entry[0]
+            if dirty:
+                texture.update(image)
+                self.uploads_count += 1
+        else:
+            # blend mode follows the image like a blit would (opaque images are copied)
+            texture = video.Texture.from_surface(self.renderer, image)
+            self._textures[sprite] = (texture, image)
+            self.uploads_count += 1
+
+        if dirty == 1:
+            sprite.dirty = 0 # type: ignore
+
+        return texture
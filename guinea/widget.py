@@ -6,11 +6,23 @@ import uuid
 
 import pygame as pg
 
-from guinea import _internal
+from guinea import _internal, events, pointer, scheduler, surface_pool, workers
 from guinea.enums import MainAxisSize
 
 
 class Widget(pg.sprite.DirtySprite, abc.ABC):
+    # widgets which build their whole image in `render_image`, without modifying
+    # their own state, can be redrawn on a worker thread (see `guinea.workers`)
+    supports_threaded_redraw = False
+
+    # attributes (besides `rect`) set by `calculate_size`, which are enough to restore the widget
+    # layout without recalculating it (see `guinea.layout_file`), or `None` if it cannot be restored
+    layout_state_attributes: tuple[str, ...] | None = None
+
+    # redraws can be time-sliced (see `guinea.scheduler`), widgets with higher priority are redrawn first
+    supports_scheduled_redraw = True
+    redraw_priority = 0
+
     @staticmethod
     def generate_widget_id() -> uuid.UUID:
         return uuid.uuid4()
@@ -36,6 +48,14 @@ class Widget(pg.sprite.DirtySprite, abc.ABC):
         self._needs_recalculate = True
         self._needs_reposition = True
 
+        # size of the widget at the time of its last redraw
+        self._drawn_size = (-1, -1)
+
+        # composited widgets are drawn directly into surface of their ancestor (see `draw_into`)
+        # and their own image is only updated when it is actually needed
+        self._is_composited = False
+        self._image_outdated = False
+
         self.parent: ContainerWidget | None = None
 
     def set_layer(self, layer: int) -> None:
@@ -47,6 +67,9 @@ class Widget(pg.sprite.DirtySprite, abc.ABC):
         self.visible = is_visible
 
     def kill(self) -> None:
+        events.unregister_owner(self)
+        pointer.unregister_owner(self)
+
         super().kill()
 
     def set_parent(self, parent: ContainerWidget) -> None:
@@ -64,6 +87,10 @@ class Widget(pg.sprite.DirtySprite, abc.ABC):
     def update(self, *args: t.Any, **kwargs: t.Any) -> None:
         super().update(*args, **kwargs)
 
+        # finished threaded redraws are committed once per tree, before any of its widgets is updated
+        if self.parent is None:
+            workers.commit()
+
         assert not (self.parent is None and self.rect is None), 'Cannot determine size and position of the widget, because parent and rect are not set'
 
         target_rect: pg.Rect
@@ -80,15 +107,89 @@ class Widget(pg.sprite.DirtySprite, abc.ABC):
             self.set_placement(target_rect.x, target_rect.y)
             self._needs_redraw = True
 
+        # widget could have been resized by its parent layout
+        if self.rect.size != self._drawn_size:
+            self._needs_redraw = True
+
         if self._needs_redraw:
-            self.redraw()
             self._needs_redraw = False
+            self._drawn_size = self.rect.size
+
+            if self._is_composited and self.can_draw_into():
+                self._image_outdated = True
+                self.dirty = 1
+            elif not workers.submit(self) and not scheduler.schedule(self):
+                self.redraw()
+                self.dirty = 1
+
+    def get_layout_state(self) -> tuple[tuple[int, int, int, int], tuple[t.Any, ...]] | None:
+        '''
+        Returns picklable state of the last layout pass or `None` if the widget does not support it.
+        '''
+
+        if self.layout_state_attributes is None:
+            return None
+
+        return (
+            (self.rect.x, self.rect.y, self.rect.width, self.rect.height),
+            tuple(getattr(self, name) for name in self.layout_state_attributes))
+
+    def restore_layout_state(self, state: tuple[tuple[int, int, int, int], tuple[t.Any, ...]]) -> None:
+        assert self.layout_state_attributes is not None, f'{type(self).__name__} does not support restoring its layout.'
+
+        rect, values = state
+
+        self.rect.update(rect)
+        for name, value in zip(self.layout_state_attributes, values):
+            setattr(self, name, value)
+
+        self._needs_recalculate = False
+        self._needs_reposition = False
+
+    def set_composited(self, is_composited: bool) -> None:
+        self._is_composited = is_composited
+
+    def can_draw_into(self) -> bool:
+        '''
+        Returns `True` if the widget can draw itself directly into a surface
+        of its ancestor, without needing alpha isolation of its own image.
+        '''
+
+        return False
+
+    def draw_into(self, target: pg.Surface) -> None:
+        '''
+        Draws the widget into `target`, which has the same size as the widget.
+        '''
 
-            self.dirty = 1
+        raise NotImplementedError(f'{type(self).__name__} does not support drawing directly into a surface.')
+
+    def ensure_image(self) -> None:
+        '''
+        Redraws own image of a composited widget if it was skipped.
+        '''
+
+        if self._image_outdated:
+            self._image_outdated = False
+            self.redraw()
 
     def redraw(self) -> None:
         self._needs_redraw = False
 
+    def replace_image(self, image: pg.Surface) -> None:
+        '''
+        Assigns new image and returns the previous one to the surface pool.
+        '''
+
+        old_image: pg.Surface | None = getattr(self, 'image', None)
+        self.image = image
+
+        if old_image is not None and old_image is not image:
+            surface_pool.release(old_image)
+
+    def render_image(self) -> pg.Surface:
+        raise NotImplementedError(f'{type(self).__name__} does not support rendering its image separately.')
+
     @property
     def id(self) -> uuid.UUID:
         return self._id
@@ -97,7 +198,37 @@ class Widget(pg.sprite.DirtySprite, abc.ABC):
     def needs_redraw(self) -> bool:
         return self._needs_redraw
 
+    def get_screen_rect(self) -> pg.Rect:
+        '''
+        Returns rect of the widget in screen coordinates, clipped to areas in which
+        its ancestors show their children.
+        '''
+
+        rect = self.rect
+
+        parent: Widget | None = self.parent
+        while parent is not None:
+            rect = parent.map_child_rect(rect)
+            parent = parent.parent
+
+        return rect
+
+    def map_child_rect(self, rect: pg.Rect) -> pg.Rect:
+        '''
+        Maps rect of a child to the coordinates the widget itself is placed in. Widgets which
+        draw their children into own image (e.g. `Window`) place them in own coordinates.
+        '''
+
+        return rect
+
+    @property
+    def needs_layout(self) -> bool:
+        return self._needs_recalculate or self._needs_reposition
+
 class ContainerWidget(Widget):
+    # redraw of containers is generally a no-op (`Container` is an exception)
+    supports_scheduled_redraw = False
+
     def __init__(self,
                  children: list[Widget],
                  _id: uuid.UUID | None = None,
@@ -111,6 +242,9 @@ class ContainerWidget(Widget):
         self.visible = False
         self.dirty = 0
 
+        # containers are invisible, but groups which ignore visibility still blit their image
+        self.image = surface_pool.get_empty()
+
     def set_layer(self, layer: int) -> None:
         for child in self._children:
             child.set_layer(layer)
@@ -142,6 +276,8 @@ class ContainerWidget(Widget):
         return len(self._children)
 
 class AxialContainerWidget(ContainerWidget):
+    layout_state_attributes = ('_max_child_space', '_child_offsets')
+
     def __init__(self,
                  children: list[Widget],
                  spacing: int,
@@ -156,72 +292,116 @@ class AxialContainerWidget(ContainerWidget):
         self._max_child_space = 0
         self._main_axis_size = main_axis_size
 
+        # offsets of children along the main axis, computed by `calculate_size`
+        self._child_offsets = [0] * len(children)
+
     def _calculate_available_space(self, max_width: int, max_height: int) -> int:
         spacing_required = self._spacing * (self.children_count - 1)
         return (max_height if self._axis else max_width) - spacing_required
 
+    def _calculate_child_size(self, child: Widget, main_axis_space: int, max_width: int, max_height: int) -> tuple[int, int]:
+        if self._axis:
+            return child.calculate_size(max_width, main_axis_space)
+
+        return child.calculate_size(main_axis_space, max_height)
+
     def _space_children_evenly(self, max_width: int, max_height: int) -> tuple[int, int]:
         available_space = self._calculate_available_space(max_width, max_height)
         self._max_child_space = _internal.divide_with_overflow(available_space, self.children_count)
 
-        width_used = height_used = 0
-        for child in self._children:
-            if self._axis:
-                child_width, _ = child.calculate_size(max_width, self._max_child_space)
+        cross_size_used = 0
+        for i, child in enumerate(self._children):
+            child_width, child_height = self._calculate_child_size(child, self._max_child_space, max_width, max_height)
+            cross_size_used = max(cross_size_used, child_width if self._axis else child_height)
 
-                width_used = max(width_used, child_width)
-                height_used += self._max_child_space + self._spacing
-            else:
-                _, child_height = child.calculate_size(self._max_child_space, max_height)
+            self._child_offsets[i] = i * (self._max_child_space + self._spacing)
 
-                width_used += self._max_child_space + self._spacing
-                height_used = max(height_used, child_height)
+        main_size_used = self.children_count * (self._max_child_space + self._spacing) - self._spacing
 
-        if self._axis:
-            height_used -= self._spacing
-        else:
-            width_used -= self._spacing
-
-        return (width_used, height_used)
+        return (cross_size_used, main_size_used) if self._axis else (main_size_used, cross_size_used)
 
     def _space_children_min_size(self, max_width: int, max_height: int) -> tuple[int, int]:
         available_space = self._calculate_available_space(max_width, max_height)
         self._max_child_space = _internal.divide_with_overflow(available_space, self.children_count)
 
-        width_used = height_used = 0
+        main_sizes = list[int]()
+        cross_size_used = 0
         for child in self._children:
+            # children which do not fit anymore are still laid out, but without any space
             if available_space < 0:
-                break
+                self._calculate_child_size(child, 0, max_width, max_height)
 
-            if self._axis:
-                child_width, child_height = child.calculate_size(max_width, available_space)
-                child_height += self._spacing
+                # neither the child nor its spacing take any space
+                main_sizes.append(-self._spacing)
+                continue
 
-                height_used += child_height
-                width_used = max(width_used, child_width)
+            child_width, child_height = self._calculate_child_size(child, available_space, max_width, max_height)
+            child_main_size = child_height if self._axis else child_width
 
-                available_space -= child_height
-            else:
-                child_width, child_height = child.calculate_size(available_space, max_height)
-                child_width += self._spacing
+            main_sizes.append(child_main_size)
+            cross_size_used = max(cross_size_used, child_width if self._axis else child_height)
 
-                height_used = max(height_used, child_height)
-                width_used += child_width
+            available_space -= child_main_size + self._spacing
 
-                available_space -= child_width
+        return self._finish_main_axis_layout(main_sizes, cross_size_used)
 
-        if self._axis:
-            height_used -= self._spacing
-        else:
-            width_used -= self._spacing
+    def _space_children_flex(self, max_width: int, max_height: int) -> tuple[int, int]:
+        # imported here, because flex module depends on this one
+        from guinea.flex import Flex, distribute_flex_space
+
+        available_space = max(self._calculate_available_space(max_width, max_height), 0)
 
-        return (width_used, height_used)
+        # inflexible children take their preferred size first
+        main_sizes = [0] * self.children_count
+        flexible_children = list[tuple[int, Flex]]()
+        cross_size_used = 0
+        for i, child in enumerate(self._children):
+            if isinstance(child, Flex):
+                flexible_children.append((i, child))
+                continue
+
+            child_width, child_height = self._calculate_child_size(child, available_space, max_width, max_height)
+
+            main_sizes[i] = child_height if self._axis else child_width
+            cross_size_used = max(cross_size_used, child_width if self._axis else child_height)
+
+            available_space = max(available_space - main_sizes[i], 0)
+
+        # the rest of the space is shared by flexible children
+        flexible_sizes = distribute_flex_space(
+            available_space,
+            [(child.flex, child.min_size, child.max_size) for _, child in flexible_children])
+
+        for (i, child), size in zip(flexible_children, flexible_sizes):
+            child_width, child_height = self._calculate_child_size(child, size, max_width, max_height)
+
+            main_sizes[i] = size
+            cross_size_used = max(cross_size_used, child_width if self._axis else child_height)
+
+        self._max_child_space = max(main_sizes, default=0)
+
+        return self._finish_main_axis_layout(main_sizes, cross_size_used)
+
+    def _finish_main_axis_layout(self, main_sizes: list[int], cross_size_used: int) -> tuple[int, int]:
+        offset = 0
+        for i, main_size in enumerate(main_sizes):
+            self._child_offsets[i] = offset
+            offset += main_size + self._spacing
+
+        main_size_used = offset - self._spacing
+
+        return (cross_size_used, main_size_used) if self._axis else (main_size_used, cross_size_used)
 
     def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
         super().calculate_size(max_width, max_height)
 
+        if len(self._child_offsets) != self.children_count:
+            self._child_offsets = [0] * self.children_count
+
         if self._main_axis_size == MainAxisSize.EVEN:
             self.rect.size = self._space_children_evenly(max_width, max_height)
+        elif self._main_axis_size == MainAxisSize.FLEX:
+            self.rect.size = self._space_children_flex(max_width, max_height)
         else:
             self.rect.size = self._space_children_min_size(max_width, max_height)
 
@@ -230,21 +410,12 @@ class AxialContainerWidget(ContainerWidget):
     def set_placement(self, x: int, y: int) -> None:
         super().set_placement(x, y)
 
-        offset = 0
-        for child in self._children:
+        for child, offset in zip(self._children, self._child_offsets):
             if self._axis:
                 child.set_placement(x, y + offset)
             else:
                 child.set_placement(x + offset, y)
 
-            offset_increment: int
-            if self._main_axis_size == MainAxisSize.EVEN:
-                offset_increment = self._max_child_space
-            else:
-                offset_increment = child.rect.height if self._axis else child.rect.width
-
-            offset += offset_increment + self._spacing
-
 class SingleChildContainerWidget(ContainerWidget):
     def __init__(self,
                  child: Widget,
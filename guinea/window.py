@@ -1,12 +1,17 @@
+import time
 import uuid
-from typing import Any
+import weakref
+from typing import TYPE_CHECKING, Any
 
 import pygame as pg
 
-from guinea import _internal, events
+from guinea import _internal, events, pointer, surface_pool
 from guinea.enums import Side
 from guinea.widget import ContainerWidget, SingleChildContainerWidget, Widget
 
+if TYPE_CHECKING:
+    from guinea.window_manager import WindowManager
+
 RESIZE_RECT_TOLERANCE = 2
 TITLE_OFFSET = 2
 BORDER_THICKNESS = 1
@@ -20,6 +25,9 @@ DEFAULT_BORDER_COLOR = pg.Color(66, 66, 66)
 DEFAULT_BUTTON_HIGHLIGHT_COLOR = pg.Color(227, 227, 227)
 
 class Window(Widget):
+    # redraw only requests composing, which happens during update
+    supports_scheduled_redraw = False
+
     _grab_lock = False
 
     def __init__(self,
@@ -33,6 +41,8 @@ class Window(Widget):
                  border_color: pg.Color = DEFAULT_BORDER_COLOR,
                  button_highlight_color: pg.Color = DEFAULT_BUTTON_HIGHLIGHT_COLOR,
                  title_font: pg.font.Font | None = None,
+                 resize_debounce: float = 0.0,
+                 direct_draw: bool = False,
                  _id: uuid.UUID | None = None) -> None:
         super().__init__(_id, rect)
 
@@ -40,11 +50,21 @@ class Window(Widget):
         child.set_parent(self) # type: ignore
 
         self.visible = True
-        self.image = pg.Surface((0, 0))
+        self.image = surface_pool.get_empty()
+
+        # window covered by opaque windows above it is neither composed nor shown
+        self.is_occluded = False
+        self._is_shown = True
 
         self._inner_group: pg.sprite.LayeredUpdates = pg.sprite.LayeredUpdates()
         Widget.register_widget_stack(self._inner_group, child)
 
+        # in direct draw mode widgets which support it draw straight into the window surface
+        self._direct_draw = direct_draw
+        if direct_draw:
+            for sprite in self._inner_group.sprites():
+                sprite.set_composited(True)
+
         self._title_font = title_font or _internal.FontCache.get_default_of_size(TITLE_FONT_SIZE)
         self._title = title
         self._title_fg = title_fg
@@ -70,34 +90,85 @@ class Window(Widget):
         self._highlight_close_btn = False
 
         self._is_minimized = False
+        self._needs_compose = True
+
+        # child is laid out only when its available size changes, at most once per update and
+        # (during border drag) only after the size did not change for `resize_debounce` seconds
+        self._resize_debounce = resize_debounce
+        self._last_resize_time = 0.0
+        self._child_layout_size: tuple[int, int] | None = None
+        self._child_layout_pending = False
+
+        # window added to a manager receives input only through it
+        self._manager: WindowManager | None = None
+        self._register_handlers()
+
+    @property
+    def is_minimized(self) -> bool:
+        return self._is_minimized
+
+    def set_minimized(self, is_minimized: bool) -> None:
+        if is_minimized == self._is_minimized:
+            return
+
+        self._is_minimized = is_minimized
+        self.child.set_visible(not is_minimized)
+
+        self._needs_recalculate = True
+        self._needs_redraw = True
+        self._needs_reposition = True
+
+    def collides_with(self, pos: tuple[int, int]) -> bool:
+        '''
+        Returns `True` if the window (including its resize borders) is under given screen position.
+        '''
+
+        rect = self._title_bar_rect if self._is_minimized else self.rect
+        return rect.inflate(RESIZE_RECT_TOLERANCE * 2, RESIZE_RECT_TOLERANCE * 2).collidepoint(pos)
 
+    def map_child_rect(self, rect: pg.Rect) -> pg.Rect:
+        # children are placed relative to the window surface and clipped to the client area
+        return rect.clip(self._child_rect).move(self.rect.topleft)
+
+    def _register_handlers(self) -> None:
         events.register_handler(pg.MOUSEBUTTONDOWN, self._mouse_button_down_callback)
-        events.register_handler(pg.MOUSEMOTION, self._mouse_move_callback)
         events.register_handler(pg.MOUSEBUTTONUP, self._mouse_button_up_callback)
+        pointer.register_motion_listener(self._pointer_motion_callback)
+
+    def _unregister_handlers(self) -> None:
+        events.unregister_owner(self)
+        pointer.unregister_owner(self)
+
+    def _set_button_highlights(self, highlight_minimize_btn: bool, highlight_close_btn: bool) -> None:
+        if highlight_minimize_btn != self._highlight_minimize_btn:
+            self._highlight_minimize_btn = highlight_minimize_btn
+            self._needs_redraw = True
+
+        if highlight_close_btn != self._highlight_close_btn:
+            self._highlight_close_btn = highlight_close_btn
+            self._needs_redraw = True
 
     def _mouse_button_up_callback(self, _: pg.event.Event) -> None:
+        # apply motion which happened before the button was released
+        pointer.flush()
+
         Window._grab_lock = False
 
         self.is_moving = False
         self.resize_side = None
 
-    def _mouse_move_callback(self, event: pg.event.Event) -> None:
+    def _pointer_motion_callback(self, pos: tuple[int, int], rel: tuple[int, int]) -> None:
         # handle window move
         if self.is_moving:
-            self.rect.move_ip(event.rel)
+            self.rect.move_ip(rel)
+            self._needs_recalculate = True
             self._needs_redraw = True
             self._needs_reposition = True
 
         # handle button highlights
-        highlight_minimize_btn = self._minimize_btn_collide_rect.collidepoint(event.pos)
-        if highlight_minimize_btn != self._highlight_minimize_btn:
-            self._highlight_minimize_btn = highlight_minimize_btn
-            self._needs_redraw = True
-
-        highlight_close_btn = self._close_btn_collide_rect.collidepoint(event.pos)
-        if highlight_close_btn != self._highlight_close_btn:
-            self._highlight_close_btn = highlight_close_btn
-            self._needs_redraw = True
+        self._set_button_highlights(
+            bool(self._minimize_btn_collide_rect.collidepoint(pos)),
+            bool(self._close_btn_collide_rect.collidepoint(pos)))
 
         # handle window resize
         if self.resize_side is not None:
@@ -105,17 +176,22 @@ class Window(Widget):
 
             match self.resize_side:
                 case Side.LEFT:
-                    self.rect.left += event.rel[0]
-                    self.rect.width -= event.rel[0]
+                    self.rect.left += rel[0]
+                    self.rect.width -= rel[0]
                 case Side.RIGHT:
-                    self.rect.width += event.rel[0]
+                    self.rect.width += rel[0]
                 case Side.BOTTOM:
-                    self.rect.height += event.rel[1]
+                    self.rect.height += rel[1]
 
+            self._last_resize_time = time.perf_counter()
+
+            self._needs_recalculate = True
             self._needs_redraw = True
             self._needs_reposition = True
 
     def _mouse_button_down_callback(self, event: pg.event.Event) -> None:
+        pointer.flush()
+
         # handle close button collision
         if self._close_btn_collide_rect.collidepoint(event.pos):
             self.kill()
@@ -125,11 +201,10 @@ class Window(Widget):
 
         # handle minimize button collision
         if self._minimize_btn_collide_rect.collidepoint(event.pos):
-            self._is_minimized = not self._is_minimized
-            self.child.set_visible(not self._is_minimized)
-
-            self._needs_redraw = True
-            self._needs_reposition = True
+            if self._manager is not None:
+                self._manager.minimize(self, not self._is_minimized)
+            else:
+                self.set_minimized(not self._is_minimized)
 
         # handle move collision
         if self._title_bar_rect.collidepoint(event.pos) and not Window._grab_lock:
@@ -137,14 +212,10 @@ class Window(Widget):
 
             self.is_moving = True
 
-            groups = self.groups()
-            assert len(groups) == 1, 'Window does not support usage within multiple sprite groups'
-
-            group = groups[0]
-            assert isinstance(group, pg.sprite.LayeredUpdates), 'Window requires to be placed inside sprite group that supports LayeredUpdates'
-
-            top_layer = group.get_top_layer()
-            self.set_layer(top_layer)
+            if self._manager is not None:
+                self._manager.focus(self)
+            else:
+                self._move_to_top_layer()
 
         # handle resize collision
         if not self._is_minimized:
@@ -153,8 +224,25 @@ class Window(Widget):
                     self.resize_side = side
                     break
 
+    def _move_to_top_layer(self) -> None:
+        groups = self.groups()
+        assert len(groups) == 1, 'Window does not support usage within multiple sprite groups'
+
+        group = groups[0]
+        assert isinstance(group, pg.sprite.LayeredUpdates), 'Window requires to be placed inside sprite group that supports LayeredUpdates'
+
+        top_layer = group.get_top_layer()
+        self.set_layer(top_layer)
+
+    # window is composed once per update, after its children were updated
     def redraw(self) -> None:
-        self.image = pg.Surface(self.rect.size, pg.SRCALPHA)
+        self._needs_compose = True
+
+    def _compose(self) -> None:
+        if self.image.get_size() == self.rect.size:
+            self.image.fill((0, 0, 0, 0))
+        else:
+            self.replace_image(surface_pool.acquire(self.rect.size, pg.SRCALPHA))
 
         title_bar_rect_abs = pg.Rect(
             0,
@@ -198,7 +286,8 @@ class Window(Widget):
                 self._btn_width)
 
         # draw title
-        title_surf = self._title_font.render(self._title, True, self._title_fg, self._title_bg)
+        with _internal.font_lock:
+            title_surf = self._title_font.render(self._title, True, self._title_fg, self._title_bg)
         self.image.blit(title_surf, (self._btn_margin * 2 + self._btn_width, TITLE_OFFSET))
 
         # draw buttons
@@ -213,13 +302,116 @@ class Window(Widget):
             close_btn_img,
             (title_bar_rect_abs.right - self._btn_width - self._btn_margin, self._btn_margin))
 
-        self._inner_group.draw(self.image)
+        if not self._is_minimized:
+            self._draw_children()
+
+    def _draw_children(self) -> None:
+        # children are clipped to the window client area, those outside of it are not drawn at all
+        clip_rect = self._child_rect
+        self.image.set_clip(clip_rect)
+
+        for sprite in self._inner_group.sprites():
+            if not sprite.visible or not sprite.rect.colliderect(clip_rect):
+                continue
+
+            # in direct draw mode widgets which support it draw straight into the window surface
+            if self._direct_draw and sprite.can_draw_into() and clip_rect.contains(sprite.rect):
+                sprite.draw_into(self.image.subsurface(sprite.rect))
+            else:
+                sprite.ensure_image()
+                self.image.blit(sprite.image, sprite.rect)
+
+        self.image.set_clip(None)
+
+    def kill(self) -> None:
+        if self._manager is not None:
+            self._manager.remove(self)
+
+        self.child.kill()
+
+        super().kill()
 
     def update(self, *args: Any, **kwargs: Any) -> None:
+        pointer.flush()
+
+        if self._child_layout_pending and time.perf_counter() - self._last_resize_time >= self._resize_debounce:
+            self._needs_recalculate = True
+
         super().update(*args, **kwargs)
+
+        # occluded window is brought up to date once it becomes visible again
+        self._set_occluded(self._calculate_is_occluded())
+        if self.is_occluded:
+            return
+
         self._inner_group.update(*args, **kwargs)
 
+        for sprite in self._inner_group.sprites():
+            if sprite.dirty:
+                sprite.dirty = 0
+                self._needs_compose = True
+
+        if self._needs_compose:
+            self._needs_compose = False
+            self._compose()
+            self.dirty = 1
+
+    def set_visible(self, is_visible: bool) -> None:
+        self._is_shown = is_visible
+
+        super().set_visible(is_visible and not self.is_occluded)
+
+    def get_opaque_rect(self) -> pg.Rect | None:
+        '''
+        Returns part of the screen fully covered by the window or `None` if the window is translucent.
+        '''
+
+        if not self._is_shown or self._title_bg.a != 255:
+            return None
+
+        if self._is_minimized:
+            return self._title_bar_rect
+
+        return self.rect if self._window_bg.a == 255 else None
+
+    def _calculate_is_occluded(self) -> bool:
+        if self._manager is not None:
+            return self._manager._pop_is_occluded(self)
+
+        groups = self.groups()
+        if len(groups) != 1 or not isinstance(groups[0], pg.sprite.LayeredUpdates):
+            return False
+
+        group = groups[0]
+
+        # occlusion of all windows of the group is computed in a single pass by the first window
+        # updated in a frame, the other windows only take their result
+        occlusion = _group_occlusion.get(group)
+        if occlusion is None or self not in occlusion:
+            occlusion = _calculate_occlusion([x for x in group.sprites() if isinstance(x, Window)])
+            _group_occlusion[group] = occlusion
+
+        return occlusion.pop(self)
+
+    def _set_occluded(self, is_occluded: bool) -> None:
+        if is_occluded == self.is_occluded:
+            return
+
+        self.is_occluded = is_occluded
+
+        # groups which respect visibility (e.g. `LayeredDirty`) do not blit occluded windows
+        self.visible = self._is_shown and not is_occluded
+
+        if is_occluded:
+            # plain `LayeredUpdates` ignores visibility, so the image is returned to the pool
+            # and replaced by an empty placeholder, whose blit does nothing
+            self.replace_image(surface_pool.get_empty())
+        else:
+            self._needs_compose = True
+
     def calculate_size(self, max_width: int, max_height: int) -> tuple[int, int]:
+        super().calculate_size(max_width, max_height)
+
         self.rect.width = max_width
         self.rect.height = max_height
 
@@ -245,15 +437,31 @@ class Window(Widget):
 
         if not self._is_minimized:
             self._child_rect = _calculate_child_rect(self.rect, self._title_bar_rect)
-            self.child.calculate_size(self._child_rect.width, self._child_rect.height)
+            self._layout_child()
 
         return (max_width, max_height)
 
-    def set_placement(self, x: int, y: int) -> None:
-        super().set_placement(x, y)
+    def _layout_child(self) -> None:
+        child_size = self._child_rect.size
+        if child_size == self._child_layout_size and not self._child_layout_pending:
+            return
+
+        is_resizing = self.resize_side is not None or self._child_layout_pending
+        if is_resizing and time.perf_counter() - self._last_resize_time < self._resize_debounce:
+            self._child_layout_pending = True
+            return
 
+        self.child.calculate_size(*child_size)
         self.child.set_placement(self._child_rect.x, self._child_rect.y)
 
+        self._child_layout_size = child_size
+        self._child_layout_pending = False
+
+    # child is placed relative to the window surface during its layout, so moving
+    # the window does not require placing it again
+    def set_placement(self, x: int, y: int) -> None:
+        super().set_placement(x, y)
+
 def _calculate_title_bar_rect(base_rect: pg.Rect, title_font: pg.font.Font) -> pg.Rect:
     return pg.Rect(
         base_rect.x,
@@ -274,6 +482,51 @@ def _calculate_child_rect(base_rect: pg.Rect, title_rect: pg.Rect) -> pg.Rect:
         base_rect.width - BORDER_THICKNESS * 2,
         base_rect.height - title_rect.height - BORDER_THICKNESS * 2)
 
+def _calculate_occlusion(windows: list[Window]) -> dict[Window, bool]:
+    '''
+    Returns which of the windows (ordered from the bottom to the top) are fully covered by opaque windows above them.
+    '''
+
+    result = dict[Window, bool]()
+    covering_rects = list[pg.Rect]()
+
+    for window in reversed(windows):
+        result[window] = _is_rect_covered(window.rect, covering_rects)
+
+        if (rect := window.get_opaque_rect()) is not None:
+            covering_rects.append(rect)
+
+    return result
+
+def _is_rect_covered(rect: pg.Rect, covering_rects: list[pg.Rect]) -> bool:
+    # parts of the rect which are not covered yet
+    uncovered_rects = [rect]
+
+    for covering_rect in covering_rects:
+        remaining_rects = list[pg.Rect]()
+        for uncovered_rect in uncovered_rects:
+            if uncovered_rect.colliderect(covering_rect):
+                remaining_rects.extend(_subtract_rect(uncovered_rect, covering_rect))
+            else:
+                remaining_rects.append(uncovered_rect)
+
+        uncovered_rects = remaining_rects
+        if len(uncovered_rects) == 0:
+            return True
+
+    return False
+
+def _subtract_rect(rect: pg.Rect, other: pg.Rect) -> list[pg.Rect]:
+    clip = rect.clip(other)
+
+    parts = (
+        pg.Rect(rect.left, rect.top, rect.width, clip.top - rect.top),
+        pg.Rect(rect.left, clip.bottom, rect.width, rect.bottom - clip.bottom),
+        pg.Rect(rect.left, clip.top, clip.left - rect.left, clip.height),
+        pg.Rect(clip.right, clip.top, rect.right - clip.right, clip.height))
+
+    return [x for x in parts if x.width > 0 and x.height > 0]
+
 def _calculate_border_collide_rects(base_rect: pg.Rect, tolerance: int) -> list[tuple[pg.Rect, Side]]:
     result = list[tuple[pg.Rect, Side]]()
 
@@ -316,3 +569,6 @@ def _get_minimize_btn_img(is_minimized: bool, btn_width: int) -> pg.Surface:
         img = _internal._ImageCache.try_get_image('./assets/window_minimize_btn_active.png', False, True)
 
     return pg.transform.smoothscale(img, (btn_width, btn_width))
+
+# results of the last occlusion pass over windows of a group, not yet taken by the windows
+_group_occlusion = weakref.WeakKeyDictionary[pg.sprite.AbstractGroup, dict[Window, bool]]()
@@ -0,0 +1,213 @@
+import pygame as pg
+
+from guinea import events, pointer
+from guinea.window import Window, _calculate_occlusion
+
+
+class WindowManager:
+    '''
+    Owns z-order of windows placed in a sprite group and routes pointer input to them.
+    Managed windows do not handle input on their own. Mouse buttons are dispatched only
+    to the topmost window under the cursor and motion only to the hovered window
+    (or to the window which is being moved or resized).
+
+    Every raised window gets the next unused layer (starting at `base_layer`), so it is
+    moved straight to the end of the group and raising the topmost window does nothing.
+    Windows should be kept above other sprites of the group, so that raising a window
+    does not depend on the number of those sprites.
+    '''
+
+    def __init__(self, group: pg.sprite.LayeredUpdates, *, base_layer: int = 0) -> None:
+        self._group = group
+        self._next_layer = base_layer
+
+        # ordered from the bottom to the top
+        self._windows = list[Window]()
+
+        self._focused: Window | None = None
+        self._hovered: Window | None = None
+
+        # window which received the last button press, gets the matching release
+        self._grabbed: Window | None = None
+
+        # results of the last occlusion pass, not yet taken by the windows
+        self._occlusion = dict[Window, bool]()
+
+        events.register_handler(pg.MOUSEBUTTONDOWN, self._mouse_button_down_handler)
+        events.register_handler(pg.MOUSEBUTTONUP, self._mouse_button_up_handler)
+        pointer.register_motion_listener(self._pointer_motion_callback)
+
+    def add(self, window: Window) -> None:
+        '''
+        Adds window on top of the managed windows (and to the group, if it is not there yet).
+        '''
+
+        if window._manager is self:
+            return
+
+        assert window._manager is None, 'Window is already managed by another window manager'
+
+        window._unregister_handlers()
+        window._manager = self
+
+        self._windows.append(window)
+
+        if self._group.has(window):
+            self._group.change_layer(window, self._take_layer())
+        else:
+            self._group.add(window, layer=self._take_layer())
+
+    def remove(self, window: Window) -> None:
+        '''
+        Stops managing the window. The window is left in the group and handles input on its own again.
+        '''
+
+        if window._manager is not self:
+            return
+
+        self._windows.remove(window)
+
+        window._manager = None
+        window._register_handlers()
+
+        if self._hovered is window:
+            self._hovered = None
+
+        if self._grabbed is window:
+            self._grabbed = None
+
+        if self._focused is window:
+            self._focused = self._get_topmost_restored_window()
+
+    def raise_window(self, window: Window) -> None:
+        assert window._manager is self, 'Window is not managed by this window manager'
+
+        if self._windows[-1] is window:
+            return
+
+        self._windows.remove(window)
+        self._windows.append(window)
+
+        _move_to_top(self._group, window, self._take_layer())
+
+    def focus(self, window: Window) -> None:
+        self.raise_window(window)
+        self._focused = window
+
+    def minimize(self, window: Window, is_minimized: bool = True) -> None:
+        assert window._manager is self, 'Window is not managed by this window manager'
+
+        window.set_minimized(is_minimized)
+
+        if is_minimized and self._focused is window:
+            self._focused = self._get_topmost_restored_window()
+
+    def get_window_at(self, pos: tuple[int, int]) -> Window | None:
+        for window in reversed(self._windows):
+            if window._is_shown and window.collides_with(pos):
+                return window
+
+        return None
+
+    @property
+    def windows(self) -> tuple[Window, ...]:
+        return tuple(self._windows)
+
+    @property
+    def focused(self) -> Window | None:
+        return self._focused
+
+    def _pop_is_occluded(self, window: Window) -> bool:
+        # computed from the z-order in a single pass by the first window updated in a frame
+        if window not in self._occlusion:
+            self._occlusion = _calculate_occlusion(self._windows)
+
+        return self._occlusion.pop(window, False)
+
+    def _take_layer(self) -> int:
+        layer = self._next_layer
+        self._next_layer += 1
+
+        return layer
+
+    def _get_topmost_restored_window(self) -> Window | None:
+        for window in reversed(self._windows):
+            if not window.is_minimized:
+                return window
+
+        return None
+
+    def _mouse_button_down_handler(self, event: pg.event.Event) -> None:
+        pointer.flush()
+
+        window = self.get_window_at(event.pos)
+        if window is None:
+            return
+
+        self._grabbed = window
+        self.focus(window)
+
+        window._mouse_button_down_callback(event)
+
+    def _mouse_button_up_handler(self, event: pg.event.Event) -> None:
+        pointer.flush()
+
+        window = self._grabbed
+        if window is None:
+            return
+
+        self._grabbed = None
+        window._mouse_button_up_callback(event)
+
+    def _pointer_motion_callback(self, pos: tuple[int, int], rel: tuple[int, int]) -> None:
+        grabbed = self._grabbed
+        if grabbed is not None and (grabbed.is_moving or grabbed.resize_side is not None):
+            window: Window | None = grabbed
+        else:
+            window = self.get_window_at(pos)
+
+        if window is not self._hovered:
+            if self._hovered is not None:
+                self._hovered._set_button_highlights(False, False)
+
+            self._hovered = window
+
+        if window is not None:
+            window._pointer_motion_callback(pos, rel)
+
+def _move_to_top(group: pg.sprite.LayeredUpdates, sprite: pg.sprite.Sprite, layer: int) -> None:
+    change_layer = type(group).change_layer
+    if not _CAN_MOVE_TO_TOP_DIRECTLY or change_layer not in _SUPPORTED_CHANGE_LAYERS:
+        group.change_layer(sprite, layer)
+        return
+
+    sprites = group._spritelist # type: ignore
+    layers = group._spritelayers # type: ignore
+
+    # `change_layer` searches for the sprite from the start of the group, but raised windows
+    # are near its end, so the sprite is searched from the end and appended if it stays on top
+    if len(sprites) == 0 or layers[sprites[-1]] > layer:
+        group.change_layer(sprite, layer)
+        return
+
+    for i in range(len(sprites) - 1, -1, -1):
+        if sprites[i] is sprite:
+            del sprites[i]
+            break
+
+    sprites.append(sprite)
+    layers[sprite] = layer
+
+    if hasattr(sprite, '_layer'):
+        sprite._layer = layer # type: ignore
+
+    # same as `LayeredDirty.change_layer`
+    if change_layer is pg.sprite.LayeredDirty.change_layer and sprite.dirty == 0: # type: ignore
+        sprite.dirty = 1 # type: ignore
+
+# `_move_to_top` reproduces these `change_layer` implementations using internals of `LayeredUpdates`,
+# which are only relied on in pygame 2 and only if they are present, otherwise `change_layer` is used
+_SUPPORTED_CHANGE_LAYERS = (pg.sprite.LayeredUpdates.change_layer, pg.sprite.LayeredDirty.change_layer)
+_CAN_MOVE_TO_TOP_DIRECTLY = (
+    pg.version.vernum[0] == 2
+    and all(hasattr(pg.sprite.LayeredUpdates(), x) for x in ('_spritelist', '_spritelayers')))
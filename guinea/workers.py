@@ -0,0 +1,108 @@
+'''
+Opt-in offloading of widget redraws to a thread pool.
+
+When enabled, widgets which support it render their new image on a worker thread
+into a private surface. Finished images are committed on the main thread (during
+update of the root widget, or explicitly with `commit`) and until then the old
+image stays on screen.
+'''
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import typing as t
+import weakref
+
+import pygame as pg
+
+if t.TYPE_CHECKING:
+    from guinea.widget import Widget
+
+def enable_threaded_redraw(max_workers: int | None = None) -> None:
+    global _executor
+
+    if _executor is not None:
+        return
+
+    _executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers,
+        thread_name_prefix='guinea-redraw')
+
+def disable_threaded_redraw() -> None:
+    '''
+    Shuts down the worker pool, waiting for the pending redraws and committing their results.
+    '''
+
+    global _executor
+
+    if _executor is None:
+        return
+
+    _executor.shutdown(wait=True)
+    _executor = None
+
+    commit()
+
+def is_threaded_redraw_enabled() -> bool:
+    return _executor is not None
+
+def submit(widget: Widget) -> bool:
+    '''
+    Schedules widget redraw on the worker pool. Returns `False` if threaded redraw
+    is disabled or the widget does not support it, in which case the widget has
+    to be redrawn immediately.
+    '''
+
+    if _executor is None or not widget.supports_threaded_redraw:
+        return False
+
+    # result of a previous job for this widget (if any) is outdated and will be dropped
+    future = _executor.submit(widget.render_image)
+    _pending[widget] = future
+
+    widget_ref = weakref.ref(widget)
+    future.add_done_callback(lambda x: _finished.append((widget_ref, x)))
+
+    return True
+
+def commit() -> None:
+    '''
+    Assigns images of all finished redraws to their widgets. Only the finished
+    jobs are visited, so calling it when nothing has finished is cheap.
+    '''
+
+    while len(_finished) > 0:
+        widget_ref, future = _finished.popleft()
+
+        widget = widget_ref()
+        if widget is None or _pending.get(widget) is not future:
+            continue
+
+        del _pending[widget]
+
+        widget.replace_image(future.result())
+        widget.dirty = 1
+
+def flush() -> None:
+    '''
+    Waits for all pending redraws and commits their results on the calling thread.
+    '''
+
+    # done callbacks run after waiters are woken up, so jobs are not taken from `_finished`
+    for widget, future in list(_pending.items()):
+        image = future.result()
+
+        del _pending[widget]
+
+        widget.replace_image(image)
+        widget.dirty = 1
+
+def get_pending_count() -> int:
+    return len(_pending)
+
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_pending = weakref.WeakKeyDictionary['Widget', concurrent.futures.Future[pg.Surface]]()
+
+# jobs are appended by worker threads once they finish (deque appends are thread-safe)
+_finished = collections.deque[tuple[weakref.ref['Widget'], concurrent.futures.Future[pg.Surface]]]()
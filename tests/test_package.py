@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run_fresh(code: str) -> subprocess.CompletedProcess[str]:
+    # the package has to be imported by a fresh interpreter, so that no submodule is imported yet
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+
+@pytest.mark.parametrize('name', ['events', 'window', 'text', 'enums', 'widget'])
+def test_submodule_resolves_after_import(name: str) -> None:
+    result = _run_fresh(f'import guinea, types; assert isinstance(guinea.{name}, types.ModuleType)')
+
+    assert result.returncode == 0, result.stderr
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    result = _run_fresh('import guinea; guinea.does_not_exist')
+
+    assert 'AttributeError' in result.stderr